@@ -1,4 +1,5 @@
-
+"""
+Auto-Coder Policy Deliberation System
 
 Advanced multi-expert policy analysis system with:
 - Problem statement generation
@@ -14,25 +15,300 @@ Advanced multi-expert policy analysis system with:
 Policy Topic: Poverty Reduction and Economic Outcome in Urban Areas
 """
 
+import argparse
+import atexit
+import logging
 import os
+import queue
+import re
 import sys
+import threading
+import traceback
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Any, Optional, Callable
 from textwrap import dedent
 from crewai import Crew, Process
 from dotenv import load_dotenv
 
+# Console output goes through a queue so emitting a line never blocks the
+# calling thread on stdout; a single listener thread does the actual I/O.
+logger = logging.getLogger("deliberation")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
+logger.addHandler(_queue_handler)
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = QueueListener(_log_queue, _console_handler)
+_log_listener.start()
+
+
+def _stop_console_queue():
+    """
+    Drain the queued log lines and write any later ones straight to stdout
+    
+    Runs once: at exit, or before an interactive session starts prompting
+    so input() never shows up ahead of earlier output.
+    """
+    if _queue_handler not in logger.handlers:
+        return
+    logger.removeHandler(_queue_handler)
+    _log_listener.stop()
+    logger.addHandler(_console_handler)
+
+
+atexit.register(_stop_console_queue)
+
+
 # Import agent and task systems
 from ai_agent import DecisionAgent
 from ai_agent_task import AgentTaskSystem
 
+# Load environment variables once per process (survives re-imports on reload)
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
+
 # Try to import uAgents adapter for Agentverse integration (optional)
 try:
     from uagents_adapter import CrewaiRegisterTool
     UAGENTS_AVAILABLE = True
 except ImportError:
     UAGENTS_AVAILABLE = False
-    print("Note: uagents_adapter not available. Agentverse integration disabled.")
+    logger.info("Note: uagents_adapter not available. Agentverse integration disabled.")
+
+
+# Agents are stateless between deliberations, so one pool is built per
+# process and shared by every AutoPolicyDeliberationSystem instance.
+_AGENT_POOL: Dict[str, Any] = {}
+_AGENT_POOL_LOCK = threading.Lock()
+
+# Caps how many deliberations may rent the shared pool at the same time.
+# Defaults to one because pooled agents are reused, not copied, per run.
+_DELIBERATION_SLOTS = threading.BoundedSemaphore(
+    int(os.getenv("MAX_CONCURRENT_DELIBERATIONS", "1"))
+)
+
+
+# Vote categories from AgentTaskSystem.create_voting_task and their weights
+# as used by the voting coordinator (Strongly Support=+2 ... Strongly Oppose=-2)
+VOTE_WEIGHTS = {
+    "STRONGLY SUPPORT": 2,
+    "SUPPORT": 1,
+    "CONDITIONAL": 0,
+    "OPPOSE": -1,
+    "STRONGLY OPPOSE": -2,
+    "ABSTAIN": 0,
+}
+_VOTE_RE = re.compile(
+    r"VOTE:\W*(STRONGLY SUPPORT|STRONGLY OPPOSE|SUPPORT|CONDITIONAL|OPPOSE|ABSTAIN)",
+    re.IGNORECASE,
+)
+
+
+def tally_votes(voting_results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Tally expert votes in a single pass over the vote texts
+    
+    Args:
+        voting_results: Vote outputs keyed by expert role
+        
+    Returns:
+        Dictionary with per-category counts, weighted score and mean score
+    """
+    counts = dict.fromkeys(VOTE_WEIGHTS, 0)
+    unparsed = 0
+    for result in voting_results.values():
+        match = _VOTE_RE.search(str(result))
+        if match:
+            counts[match.group(1).upper()] += 1
+        else:
+            unparsed += 1
+    
+    weighted_score = sum(VOTE_WEIGHTS[vote] * n for vote, n in counts.items())
+    counted = sum(counts.values()) - counts["ABSTAIN"]
+    
+    return {
+        'counts': counts,
+        'unparsed': unparsed,
+        'weighted_score': weighted_score,
+        'mean_score': weighted_score / counted if counted else 0.0,
+    }
+
+
+# Full tracebacks of failed deliberations, keyed by the traceback_id returned
+# to the caller; bounded so a long-running agent cannot grow it forever
+_MAX_TRACEBACKS = 1024
+_TRACEBACKS: "OrderedDict[str, str]" = OrderedDict()
+_TRACEBACKS_LOCK = threading.Lock()
+
+
+def _store_traceback(tb_text: str) -> str:
+    """Keep a traceback for later lookup and return its identifier"""
+    traceback_id = uuid.uuid4().hex
+    with _TRACEBACKS_LOCK:
+        _TRACEBACKS[traceback_id] = tb_text
+        while len(_TRACEBACKS) > _MAX_TRACEBACKS:
+            _TRACEBACKS.popitem(last=False)
+    return traceback_id
+
+
+def get_traceback(traceback_id: str) -> Optional[str]:
+    """Look up the full traceback of a failed deliberation"""
+    with _TRACEBACKS_LOCK:
+        return _TRACEBACKS.get(traceback_id)
+
+
+def _excerpt(result: Any, limit: int) -> str:
+    """Stringify an agent result once and truncate it for the report"""
+    text = str(result)
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def _digest(result: Any, budget: int) -> str:
+    """
+    Extractive digest of an agent output within a character budget
+    
+    Keeps whole leading sentences (agents lead with their position) and
+    collapses whitespace, so later prompts stay bounded however long the
+    original contribution was.
+    
+    Args:
+        result: Agent output to compress
+        budget: Maximum number of characters to keep
+        
+    Returns:
+        The digest text
+    """
+    text = " ".join(str(result).split())
+    if len(text) <= budget:
+        return text
+    
+    kept, used = [], 0
+    for sentence in _SENTENCE_RE.split(text):
+        if used + len(sentence) + 1 > budget:
+            break
+        kept.append(sentence)
+        used += len(sentence) + 1
+    
+    # A single overlong opening sentence is hard-truncated instead
+    return " ".join(kept) if kept else text[:budget - 3] + "..."
+
+
+def _digest_all(results: Dict[str, Any], max_chars: int) -> Dict[str, str]:
+    """Digest every expert's output, splitting max_chars evenly between them"""
+    if not results:
+        return {}
+    budget = max(80, max_chars // len(results))
+    return {role: _digest(result, budget) for role, result in results.items()}
+
+
+def _format_digests(digests: Dict[str, str]) -> str:
+    """Render per-expert digests as a prompt section"""
+    return "\n".join(
+        f"- {role.replace('_', ' ').title()}: {text}" for role, text in digests.items()
+    )
+
+
+def _build_report(results: Dict[str, Any], policy_topic: str,
+                  generated_at: datetime) -> str:
+    """
+    Render the final summary report from deliberation results
+    
+    Pure function of its arguments (no I/O, no orchestrator state) so it can
+    be handed to an executor or reused by other front ends.
+    
+    Args:
+        results: The orchestrator's deliberation_results dictionary
+        policy_topic: The policy that was deliberated
+        generated_at: Timestamp printed in the report header
+        
+    Returns:
+        The full report text
+    """
+    report = []
+    report.append("="*80)
+    report.append("POLICY DELIBERATION FINAL REPORT")
+    report.append("="*80)
+    report.append(f"\nPolicy Topic: {policy_topic}")
+    report.append(f"Date: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+    report.append(f"Total Experts: {len(results.get('research', {}))}")
+    report.append("\n" + "="*80)
+    
+    # Section 1: Problem Statement
+    report.append("\n\n📋 SECTION 1: PROBLEM STATEMENT")
+    report.append("="*80)
+    if 'problem_statement' in results:
+        report.append(str(results['problem_statement']))
+    
+    # Section 2: Research Findings Summary
+    report.append("\n\n📊 SECTION 2: KEY RESEARCH FINDINGS")
+    report.append("="*80)
+    if 'research' in results:
+        for role, result in results['research'].items():
+            report.append(f"\n{role.replace('_', ' ').title()}:")
+            report.append("-" * 80)
+            report.append(_excerpt(result, 500))
+    
+    # Section 3: Debate Synthesis
+    report.append("\n\n💬 SECTION 3: DEBATE SYNTHESIS")
+    report.append("="*80)
+    if 'debate' in results:
+        report.append(f"\nTotal Debate Contributions: {len(results['debate'])}")
+        report.append("\nKey Arguments Presented:")
+        report.extend(
+            f"\n• {role.replace('_', ' ').title()}"
+            for role in results['debate']
+        )
+    
+    # Section 4: Voting Results
+    report.append("\n\n🗳️  SECTION 4: VOTING RESULTS")
+    report.append("="*80)
+    if 'voting' in results:
+        report.append(f"\nTotal Votes Cast: {len(results['voting'])}")
+        tally = results.get('vote_tally')
+        if tally:
+            report.append("\nVote Tally:")
+            for vote, n in tally['counts'].items():
+                report.append(f"  {vote}: {n}")
+            report.append(f"  Weighted Score: {tally['weighted_score']} (mean {tally['mean_score']:+.2f})")
+        report.append("\nIndividual Votes:")
+        for role, result in results['voting'].items():
+            report.append(f"\n{role.replace('_', ' ').title()}:")
+            report.append(_excerpt(result, 300))
+    
+    # Section 5: Final Decision
+    report.append("\n\n⚖️  SECTION 5: FINAL DECISION")
+    report.append("="*80)
+    if 'final_announcement' in results:
+        report.append(str(results['final_announcement']))
+    
+    # Section 6: Conclusion
+    report.append("\n\n✅ SECTION 6: CONCLUSION")
+    report.append("="*80)
+    report.append("\nThis comprehensive policy deliberation involved multi-expert analysis,")
+    report.append("structured debate, and democratic voting to reach an evidence-based decision.")
+    report.append("\n" + "="*80)
+    report.append("END OF REPORT")
+    report.append("="*80 + "\n")
+    
+    return "\n".join(report)
+
+
+@lru_cache(maxsize=None)
+def _shared_agent_system() -> DecisionAgent:
+    """Process-wide DecisionAgent so the LLM client is configured once"""
+    return DecisionAgent()
 
 
 class AutoPolicyDeliberationSystem:
@@ -53,7 +329,12 @@ class AutoPolicyDeliberationSystem:
     
     def __init__(self, policy_topic: str = "", background_context: str = "", 
                  city_data: str = "", policy_type: str = "", 
-                 time_range: str = "", interests: str = ""):
+                 time_range: str = "", interests: str = "",
+                 on_result: Optional[Callable[[str, str, Any], None]] = None,
+                 max_parallel_agents: int = 8,
+                 timeout_seconds: Optional[float] = None,
+                 fail_fast: bool = False,
+                 max_context_chars: int = 8000):
         """
         Initialize the deliberation system with flexible parameters
         
@@ -64,10 +345,32 @@ class AutoPolicyDeliberationSystem:
             policy_type: Type of policy (e.g., "Economic", "Social")
             time_range: Evaluation timeframe
             interests: Specific criteria to evaluate
+            on_result: Optional callback invoked as (phase, role, result)
+                       as soon as each agent finishes, so callers can stream
+                       results instead of waiting for the whole workflow
+            max_parallel_agents: Maximum experts running concurrently within
+                                 a phase (research, debate, voting)
+            timeout_seconds: Optional per-phase limit after which unfinished
+                             experts are recorded as timed out; running
+                             calls are still waited out before moving on
+            fail_fast: Abort the deliberation on the first agent failure
+                       instead of recording the error and continuing
+            max_context_chars: Character budget for the debate and vote
+                               digests injected into later prompts
         """
-        self.agent_system = DecisionAgent()
+        self.agent_system = _shared_agent_system()
         self.task_system = AgentTaskSystem()
         self.deliberation_results = {}
+        self.on_result = on_result
+        
+        # Bounded replay buffer of the most recent agent outputs
+        self.recent_results = deque(maxlen=50)
+        
+        # Fan-out settings for the per-expert phases
+        self.max_parallel_agents = max(1, max_parallel_agents)
+        self.timeout_seconds = timeout_seconds
+        self.fail_fast = fail_fast
+        self.max_context_chars = max_context_chars
         
         # Policy parameters
         self.policy_topic = policy_topic or "Poverty Reduction and Economic Outcome in Urban Areas"
@@ -80,12 +383,86 @@ class AutoPolicyDeliberationSystem:
         # Execution state
         self.agents = None
         self.is_initialized = False
+        self.current_phase = "idle"
+        
+        logger.info("\n" + "="*80)
+        logger.info("AUTO-CODER POLICY DELIBERATION SYSTEM")
+        logger.info("="*80)
+        logger.info("Initializing multi-expert decision-making framework...")
+        logger.info("="*80 + "\n")
+    
+    def _publish(self, phase: str, role: str, result: Any):
+        """Hand a single agent result to the streaming callback as it completes"""
+        self.recent_results.append((phase, role, result))
+        if self.on_result:
+            try:
+                self.on_result(phase, role, result)
+            except Exception as e:
+                logger.warning(f"⚠️  Result callback failed for {role}: {e}")
+    
+    def _run_parallel(self, phase: str, jobs: Dict[str, Callable[[], Any]],
+                      done_message: str) -> Dict[str, Any]:
+        """
+        Fan independent agent jobs out over a thread pool and fan results in
+        
+        Experts inside a phase do not depend on each other, so their LLM
+        calls overlap instead of running back to back. Results keep the
+        submission order; a failed or timed-out job stores its exception
+        in place of a result unless fail_fast is set.
+        
+        A timeout stops waiting for results, but not-yet-started jobs are
+        cancelled and running ones are still waited out before returning:
+        threads can't be killed, and the pooled agents must not be driven by
+        a straggler while the next phase (or the next deliberation holding
+        the slot) reuses them.
+        
+        Args:
+            phase: Phase name used for streaming and thread names
+            jobs: Zero-argument callables keyed by expert role
+            done_message: Suffix for the per-expert completion log line
+            
+        Returns:
+            Dictionary of results keyed by expert role
+        """
+        results: Dict[str, Any] = dict.fromkeys(jobs)
+        pool = ThreadPoolExecutor(max_workers=self.max_parallel_agents, thread_name_prefix=phase)
+        futures = {pool.submit(job): role for role, job in jobs.items()}
+        collected = set()
+        
+        def collect(future):
+            role = futures[future]
+            collected.add(future)
+            try:
+                results[role] = future.result()
+            except Exception as e:
+                if self.fail_fast:
+                    raise
+                logger.error(f"❌ {role.replace('_', ' ').title()} failed: {type(e).__name__}: {e}")
+                results[role] = e
+                return
+            
+            self._publish(phase, role, results[role])
+            logger.info(f"✅ {role.replace('_', ' ').title()} - {done_message}")
         
-        print("\n" + "="*80)
-        print("AUTO-CODER POLICY DELIBERATION SYSTEM")
-        print("="*80)
-        print("Initializing multi-expert decision-making framework...")
-        print("="*80 + "\n")
+        try:
+            for future in as_completed(futures, timeout=self.timeout_seconds):
+                collect(future)
+        except FuturesTimeoutError:
+            # Jobs that finished after the timeout fired but before this scan
+            # still count
+            for future in futures:
+                if future not in collected and future.done():
+                    collect(future)
+            pending = [role for future, role in futures.items() if future not in collected]
+            if self.fail_fast:
+                raise TimeoutError(f"{phase} phase timed out waiting for: {', '.join(pending)}")
+            logger.error(f"❌ {phase} phase timed out; {len(pending)} experts did not finish")
+            for role in pending:
+                results[role] = TimeoutError(f"{role} did not finish within {self.timeout_seconds}s")
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        
+        return results
     
     def update_parameters(self, **kwargs):
         """
@@ -97,7 +474,7 @@ class AutoPolicyDeliberationSystem:
         for key, value in kwargs.items():
             if hasattr(self, key):
                 setattr(self, key, value)
-                print(f"Updated {key}: {value}")
+                logger.info(f"Updated {key}: {value}")
     
     def kickoff(self, inputs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -144,16 +521,17 @@ class AutoPolicyDeliberationSystem:
         # Determine execution mode
         mode = inputs.get("mode", "full") if inputs else "full"
         
-        if mode == "full":
-            return self.run_full_deliberation(self.policy_topic, self.background_context)
-        elif mode == "quick":
-            return self.run_quick_analysis()
-        elif mode == "research_only":
-            return self.run_research_only()
-        elif mode == "debate_only":
-            return self.run_debate_only()
-        else:
-            return self.run_full_deliberation(self.policy_topic, self.background_context)
+        with _DELIBERATION_SLOTS:
+            if mode == "full":
+                return self.run_full_deliberation(self.policy_topic, self.background_context)
+            elif mode == "quick":
+                return self.run_quick_analysis()
+            elif mode == "research_only":
+                return self.run_research_only()
+            elif mode == "debate_only":
+                return self.run_debate_only()
+            else:
+                return self.run_full_deliberation(self.policy_topic, self.background_context)
     
     def run(self) -> Dict[str, Any]:
         """
@@ -169,7 +547,7 @@ class AutoPolicyDeliberationSystem:
         Quick analysis mode: Research → Vote → Announce (no debate)
         Faster execution for time-sensitive decisions
         """
-        print("\n🚀 QUICK ANALYSIS MODE - Research → Vote → Announce\n")
+        logger.info("\n🚀 QUICK ANALYSIS MODE - Research → Vote → Announce\n")
         
         agents = self.initialize_agents_for_policy(self.policy_topic)
         
@@ -192,7 +570,7 @@ class AutoPolicyDeliberationSystem:
         Research-only mode: Initialize agents and conduct research phase only
         Useful for gathering data before decision-making
         """
-        print("\n🔍 RESEARCH ONLY MODE - Data Gathering Phase\n")
+        logger.info("\n🔍 RESEARCH ONLY MODE - Data Gathering Phase\n")
         
         agents = self.initialize_agents_for_policy(self.policy_topic)
         self.run_problem_statement_phase(agents, self.policy_topic, self.background_context)
@@ -209,7 +587,7 @@ class AutoPolicyDeliberationSystem:
         Debate-only mode: Assumes research is complete, runs debate and voting
         Useful when research is pre-loaded
         """
-        print("\n💬 DEBATE ONLY MODE - Argumentation and Voting\n")
+        logger.info("\n💬 DEBATE ONLY MODE - Argumentation and Voting\n")
         
         if not self.agents or not self.is_initialized:
             agents = self.initialize_agents_for_policy(self.policy_topic)
@@ -238,114 +616,132 @@ class AutoPolicyDeliberationSystem:
         Returns:
             Dictionary of agent instances keyed by role
         """
-        print("\n" + "="*80)
-        print("PHASE 1: INITIALIZATION - AGENT SETUP")
-        print("="*80)
-        print(f"Policy Topic: {policy_topic}")
-        print("\nInitializing expert agents...\n")
+        self.current_phase = "initialization"
+        logger.info("\n" + "="*80)
+        logger.info("PHASE 1: INITIALIZATION - AGENT SETUP")
+        logger.info("="*80)
+        logger.info(f"Policy Topic: {policy_topic}")
+        
+        with _AGENT_POOL_LOCK:
+            if not _AGENT_POOL:
+                logger.info("\nInitializing expert agents...\n")
+                _AGENT_POOL.update(self._build_agent_pool())
+            else:
+                logger.info(f"\n♻️  Reusing {len(_AGENT_POOL)} pooled expert agents")
+                logger.info("="*80 + "\n")
+            agents = dict(_AGENT_POOL)
+        
+        # Store agents and mark as initialized
+        self.agents = agents
+        self.is_initialized = True
+        
+        return agents
+    
+    def _build_agent_pool(self) -> Dict[str, Any]:
+        """
+        Construct every expert agent once for the shared process-wide pool
         
+        Returns:
+            Dictionary of agent instances keyed by role
+        """
         agents = {}
         
         # Speaker Experts (Orchestration)
-        print("📢 Speaker Experts:")
+        logger.info("📢 Speaker Experts:")
         agents['problem_statement'] = self.agent_system.problem_statement_expert()
-        print("   ✓ Problem Statement Clarification Expert")
+        logger.info("   ✓ Problem Statement Clarification Expert")
         
         agents['turn_management'] = self.agent_system.turn_management_expert()
-        print("   ✓ Discussion Turn Management Expert")
+        logger.info("   ✓ Discussion Turn Management Expert")
         
         agents['voting_announcement'] = self.agent_system.voting_announcement_expert()
-        print("   ✓ Voting Coordinator and Results Announcer")
+        logger.info("   ✓ Voting Coordinator and Results Announcer")
         
         # Core Policy Experts
-        print("\n💼 Core Policy Experts:")
+        logger.info("\n💼 Core Policy Experts:")
         agents['economic'] = self.agent_system.Econimic_agent()
-        print("   ✓ Economic Analyst")
+        logger.info("   ✓ Economic Analyst")
         
         agents['social'] = self.agent_system.Social_agent()
-        print("   ✓ Social Dynamics Expert")
+        logger.info("   ✓ Social Dynamics Expert")
         
         agents['geospatial'] = self.agent_system.Geospatial_agent()
-        print("   ✓ Geospatial Analyst")
+        logger.info("   ✓ Geospatial Analyst")
         
         agents['income'] = self.agent_system.Income_agents()
-        print("   ✓ Income Distribution Analyst")
+        logger.info("   ✓ Income Distribution Analyst")
         
         agents['resource'] = self.agent_system.Resource_agent()
-        print("   ✓ Resource Management Expert")
+        logger.info("   ✓ Resource Management Expert")
         
         agents['legal'] = self.agent_system.legal_agent()
-        print("   ✓ Legal Adviser")
+        logger.info("   ✓ Legal Adviser")
         
         # Economic Experts (MoE)
-        print("\n💰 Economic Experts (MoE):")
+        logger.info("\n💰 Economic Experts (MoE):")
         agents['economic_macro'] = self.agent_system.macro_economic_expert()
-        print("   ✓ Macro-Economic Analysis Expert")
+        logger.info("   ✓ Macro-Economic Analysis Expert")
         
         agents['economic_micro'] = self.agent_system.micro_economic_expert()
-        print("   ✓ Micro-Economic Analysis Expert")
+        logger.info("   ✓ Micro-Economic Analysis Expert")
         
         agents['policy_impact'] = self.agent_system.policy_impact_expert()
-        print("   ✓ Policy Impact Analysis Expert")
+        logger.info("   ✓ Policy Impact Analysis Expert")
         
         # Social Welfare Experts (MoE)
-        print("\n🏥 Social Welfare Experts (MoE):")
+        logger.info("\n🏥 Social Welfare Experts (MoE):")
         agents['healthcare_welfare'] = self.agent_system.healthcare_welfare_expert()
-        print("   ✓ Healthcare Accessibility Expert")
+        logger.info("   ✓ Healthcare Accessibility Expert")
         
         agents['education_welfare'] = self.agent_system.education_welfare_expert()
-        print("   ✓ Education and Skills Development Expert")
+        logger.info("   ✓ Education and Skills Development Expert")
         
         agents['housing_welfare'] = self.agent_system.housing_welfare_expert()
-        print("   ✓ Housing and Social Safety Net Expert")
+        logger.info("   ✓ Housing and Social Safety Net Expert")
         
         # Geospatial & Demographic Experts (MoE)
-        print("\n🗺️  Geospatial & Demographic Experts (MoE):")
+        logger.info("\n🗺️  Geospatial & Demographic Experts (MoE):")
         agents['geographic_poverty'] = self.agent_system.geographic_poverty_expert()
-        print("   ✓ Geographic Poverty Analysis Expert")
+        logger.info("   ✓ Geographic Poverty Analysis Expert")
         
         agents['demographic_policy'] = self.agent_system.demographic_policy_expert()
-        print("   ✓ Demographic-Focused Policy Expert")
+        logger.info("   ✓ Demographic-Focused Policy Expert")
         
         agents['resource_access'] = self.agent_system.resource_access_expert()
-        print("   ✓ Resource Access and Unemployment Expert")
+        logger.info("   ✓ Resource Access and Unemployment Expert")
         
         # Income Inequality Experts (MoE)
-        print("\n⚖️  Income Inequality Experts (MoE):")
+        logger.info("\n⚖️  Income Inequality Experts (MoE):")
         agents['inequality_causes'] = self.agent_system.inequality_causes_expert()
-        print("   ✓ Income Inequality Causes Expert")
+        logger.info("   ✓ Income Inequality Causes Expert")
         
         agents['income_redistribution'] = self.agent_system.income_redistribution_expert()
-        print("   ✓ Income Redistribution Policy Expert")
+        logger.info("   ✓ Income Redistribution Policy Expert")
         
         agents['inequality_impact'] = self.agent_system.inequality_impact_expert()
-        print("   ✓ Inequality Impact Assessment Expert")
+        logger.info("   ✓ Inequality Impact Assessment Expert")
         
         # Resource Allocation Experts (MoE)
-        print("\n📊 Resource Allocation Experts (MoE):")
+        logger.info("\n📊 Resource Allocation Experts (MoE):")
         agents['resource_optimization'] = self.agent_system.resource_optimization_expert()
-        print("   ✓ Resource Distribution Optimization Expert")
+        logger.info("   ✓ Resource Distribution Optimization Expert")
         
         agents['realtime_allocation'] = self.agent_system.realtime_allocation_expert()
-        print("   ✓ Real-Time Resource Prioritization Expert")
+        logger.info("   ✓ Real-Time Resource Prioritization Expert")
         
         agents['system_efficiency'] = self.agent_system.system_efficiency_expert()
-        print("   ✓ Welfare System Efficiency Expert")
+        logger.info("   ✓ Welfare System Efficiency Expert")
         
         # Feedback & Adaptation Experts (MoE)
-        print("\n🔄 Feedback & Adaptation Experts (MoE):")
+        logger.info("\n🔄 Feedback & Adaptation Experts (MoE):")
         agents['policy_monitoring'] = self.agent_system.policy_monitoring_expert()
-        print("   ✓ Policy Outcome Monitoring Expert")
+        logger.info("   ✓ Policy Outcome Monitoring Expert")
         
         agents['adaptive_policy'] = self.agent_system.adaptive_policy_expert()
-        print("   ✓ Real-Time Policy Adaptation Expert")
-        
-        print(f"\n✅ Initialized {len(agents)} expert agents")
-        print("="*80 + "\n")
+        logger.info("   ✓ Real-Time Policy Adaptation Expert")
         
-        # Store agents and mark as initialized
-        self.agents = agents
-        self.is_initialized = True
+        logger.info(f"\n✅ Initialized {len(agents)} expert agents")
+        logger.info("="*80 + "\n")
         
         return agents
     
@@ -355,11 +751,12 @@ class AutoPolicyDeliberationSystem:
         
         The problem statement expert explains the policy to all agents
         """
-        print("\n" + "="*80)
-        print("PHASE 2: PROBLEM STATEMENT CLARIFICATION")
-        print("="*80)
-        print("Expert: Problem Statement Clarification Expert")
-        print("Task: Articulate the policy challenge for all agents\n")
+        self.current_phase = "problem_statement"
+        logger.info("\n" + "="*80)
+        logger.info("PHASE 2: PROBLEM STATEMENT CLARIFICATION")
+        logger.info("="*80)
+        logger.info("Expert: Problem Statement Clarification Expert")
+        logger.info("Task: Articulate the policy challenge for all agents\n")
         
         task = self.task_system.create_problem_statement_task(
             agents['problem_statement'],
@@ -376,9 +773,10 @@ class AutoPolicyDeliberationSystem:
         
         result = crew.kickoff()
         self.deliberation_results['problem_statement'] = result
+        self._publish('problem_statement', 'problem_statement', result)
         
-        print("\n✅ Problem Statement Phase Complete")
-        print("="*80 + "\n")
+        logger.info("\n✅ Problem Statement Phase Complete")
+        logger.info("="*80 + "\n")
         
         return result
     
@@ -388,11 +786,12 @@ class AutoPolicyDeliberationSystem:
         
         The turn management expert establishes discussion rules and flow
         """
-        print("\n" + "="*80)
-        print("PHASE 3: DISCUSSION MANAGEMENT SETUP")
-        print("="*80)
-        print("Expert: Discussion Turn Management Expert")
-        print("Task: Establish debate rules and orchestration plan\n")
+        self.current_phase = "turn_management"
+        logger.info("\n" + "="*80)
+        logger.info("PHASE 3: DISCUSSION MANAGEMENT SETUP")
+        logger.info("="*80)
+        logger.info("Expert: Discussion Turn Management Expert")
+        logger.info("Task: Establish debate rules and orchestration plan\n")
         
         # Get list of participating experts (exclude speaker experts)
         expert_list = [
@@ -415,9 +814,10 @@ class AutoPolicyDeliberationSystem:
         
         result = crew.kickoff()
         self.deliberation_results['turn_management'] = result
+        self._publish('turn_management', 'turn_management', result)
         
-        print("\n✅ Turn Management Setup Complete")
-        print("="*80 + "\n")
+        logger.info("\n✅ Turn Management Setup Complete")
+        logger.info("="*80 + "\n")
         
         return result
     
@@ -427,12 +827,11 @@ class AutoPolicyDeliberationSystem:
         
         Each expert researches the policy from their domain perspective
         """
-        print("\n" + "="*80)
-        print("PHASE 4: RESEARCH PHASE - MULTI-EXPERT ANALYSIS")
-        print("="*80)
-        print("All domain experts conducting parallel research...\n")
-        
-        research_results = {}
+        self.current_phase = "research"
+        logger.info("\n" + "="*80)
+        logger.info("PHASE 4: RESEARCH PHASE - MULTI-EXPERT ANALYSIS")
+        logger.info("="*80)
+        logger.info("All domain experts conducting parallel research...\n")
         
         # Define research groups with their task creators
         research_groups = {
@@ -475,17 +874,12 @@ class AutoPolicyDeliberationSystem:
             }
         }
         
-        # Run research for each group
+        # Dispatch every group's research at once; experts work independently
+        jobs = {}
         for group_name, group_agents in research_groups.items():
-            print(f"\n{'='*80}")
-            print(f"Research Group: {group_name}")
-            print(f"{'='*80}\n")
-            
-            group_results = {}
+            logger.info(f"Research Group: {group_name}")
             for role, task_creator in group_agents.items():
                 if role in agents:
-                    print(f"📝 {role.replace('_', ' ').title()} - Starting research...")
-                    
                     task = task_creator(agents[role], policy_topic)
                     crew = Crew(
                         agents=[agents[role]],
@@ -493,20 +887,17 @@ class AutoPolicyDeliberationSystem:
                         process=Process.sequential,
                         verbose=True
                     )
-                    
-                    result = crew.kickoff()
-                    group_results[role] = result
-                    research_results[role] = result
-                    
-                    print(f"✅ {role.replace('_', ' ').title()} - Research complete\n")
-            
-            print(f"✅ {group_name} Complete\n")
+                    jobs[role] = crew.kickoff
+        
+        logger.info(f"\n📝 Dispatching {len(jobs)} research tasks "
+                    f"({self.max_parallel_agents} in parallel)...\n")
+        research_results = self._run_parallel('research', jobs, "Research complete")
         
         self.deliberation_results['research'] = research_results
         
-        print("\n" + "="*80)
-        print(f"✅ RESEARCH PHASE COMPLETE - {len(research_results)} Experts Analyzed")
-        print("="*80 + "\n")
+        logger.info("\n" + "="*80)
+        logger.info(f"✅ RESEARCH PHASE COMPLETE - {len(research_results)} Experts Analyzed")
+        logger.info("="*80 + "\n")
         
         return research_results
     
@@ -516,12 +907,11 @@ class AutoPolicyDeliberationSystem:
         
         Experts present positions and engage in structured debate
         """
-        print("\n" + "="*80)
-        print("PHASE 5: DEBATE PHASE - STRUCTURED ARGUMENTATION")
-        print("="*80)
-        print("Experts presenting positions and engaging in debate...\n")
-        
-        debate_results = {}
+        self.current_phase = "debate"
+        logger.info("\n" + "="*80)
+        logger.info("PHASE 5: DEBATE PHASE - STRUCTURED ARGUMENTATION")
+        logger.info("="*80)
+        logger.info("Experts presenting positions and engaging in debate...\n")
         
         # Get all domain experts (exclude speaker experts)
         domain_experts = [
@@ -529,14 +919,10 @@ class AutoPolicyDeliberationSystem:
             if role not in ['problem_statement', 'turn_management', 'voting_announcement']
         ]
         
-        # Run debates
+        # Create debate tasks with context from research
+        context = "Review the research findings from all experts above."
+        jobs = {}
         for role in domain_experts:
-            print(f"\n{'='*80}")
-            print(f"💬 {role.replace('_', ' ').title()} - Opening Statement & Arguments")
-            print(f"{'='*80}\n")
-            
-            # Create debate task with context from research
-            context = "Review the research findings from all experts above."
             task = self.task_system.create_debate_task(
                 agents[role],
                 policy_topic,
@@ -549,17 +935,20 @@ class AutoPolicyDeliberationSystem:
                 process=Process.sequential,
                 verbose=True
             )
-            
-            result = crew.kickoff()
-            debate_results[role] = result
-            
-            print(f"\n✅ {role.replace('_', ' ').title()} - Debate contribution complete")
+            jobs[role] = crew.kickoff
+        
+        logger.info(f"💬 {len(jobs)} experts presenting opening statements & arguments...\n")
+        debate_results = self._run_parallel('debate', jobs, "Debate contribution complete")
         
         self.deliberation_results['debate'] = debate_results
+        # Full transcripts stay for the report; later prompts get the digest
+        self.deliberation_results['debate_digest'] = _digest_all(
+            debate_results, self.max_context_chars
+        )
         
-        print("\n" + "="*80)
-        print(f"✅ DEBATE PHASE COMPLETE - {len(debate_results)} Expert Contributions")
-        print("="*80 + "\n")
+        logger.info("\n" + "="*80)
+        logger.info(f"✅ DEBATE PHASE COMPLETE - {len(debate_results)} Expert Contributions")
+        logger.info("="*80 + "\n")
         
         return debate_results
     
@@ -569,12 +958,11 @@ class AutoPolicyDeliberationSystem:
         
         Each expert casts their vote based on research and debate
         """
-        print("\n" + "="*80)
-        print("PHASE 6: VOTING PHASE - FINAL DECISION MAKING")
-        print("="*80)
-        print("Experts casting final votes...\n")
-        
-        voting_results = {}
+        self.current_phase = "voting"
+        logger.info("\n" + "="*80)
+        logger.info("PHASE 6: VOTING PHASE - FINAL DECISION MAKING")
+        logger.info("="*80)
+        logger.info("Experts casting final votes...\n")
         
         # Get all domain experts
         domain_experts = [
@@ -583,13 +971,12 @@ class AutoPolicyDeliberationSystem:
         ]
         
         # Collect votes
+        arguments_summary = "Review all research and debate contributions above."
+        debate_digest = self.deliberation_results.get('debate_digest')
+        if debate_digest:
+            arguments_summary = _format_digests(debate_digest)
+        jobs = {}
         for role in domain_experts:
-            print(f"\n{'='*80}")
-            print(f"🗳️  {role.replace('_', ' ').title()} - Casting Vote")
-            print(f"{'='*80}\n")
-            
-            # Create voting task
-            arguments_summary = "Review all research and debate contributions above."
             task = self.task_system.create_voting_task(
                 agents[role],
                 policy_topic,
@@ -602,17 +989,17 @@ class AutoPolicyDeliberationSystem:
                 process=Process.sequential,
                 verbose=True
             )
-            
-            result = crew.kickoff()
-            voting_results[role] = result
-            
-            print(f"\n✅ {role.replace('_', ' ').title()} - Vote recorded")
+            jobs[role] = crew.kickoff
+        
+        logger.info(f"🗳️  {len(jobs)} experts casting votes...\n")
+        voting_results = self._run_parallel('voting', jobs, "Vote recorded")
         
         self.deliberation_results['voting'] = voting_results
+        self.deliberation_results['vote_tally'] = tally_votes(voting_results)
         
-        print("\n" + "="*80)
-        print(f"✅ VOTING PHASE COMPLETE - {len(voting_results)} Votes Recorded")
-        print("="*80 + "\n")
+        logger.info("\n" + "="*80)
+        logger.info(f"✅ VOTING PHASE COMPLETE - {len(voting_results)} Votes Recorded")
+        logger.info("="*80 + "\n")
         
         return voting_results
     
@@ -622,14 +1009,25 @@ class AutoPolicyDeliberationSystem:
         
         Voting coordinator tallies votes and announces final decision
         """
-        print("\n" + "="*80)
-        print("PHASE 7: FINAL ANNOUNCEMENT - DECISION DECLARATION")
-        print("="*80)
-        print("Expert: Voting Coordinator and Results Announcer")
-        print("Task: Tally votes and announce final decision\n")
+        self.current_phase = "final_announcement"
+        logger.info("\n" + "="*80)
+        logger.info("PHASE 7: FINAL ANNOUNCEMENT - DECISION DECLARATION")
+        logger.info("="*80)
+        logger.info("Expert: Voting Coordinator and Results Announcer")
+        logger.info("Task: Tally votes and announce final decision\n")
         
         # Compile all votes for the announcement task
         votes_summary = "Review all votes cast by experts above."
+        votes = self.deliberation_results.get('voting')
+        if votes:
+            votes_summary = _format_digests(_digest_all(votes, self.max_context_chars))
+        tally = self.deliberation_results.get('vote_tally')
+        if tally:
+            breakdown = ", ".join(f"{vote}: {n}" for vote, n in tally['counts'].items())
+            votes_summary += (
+                f"\n\nPRE-COMPUTED TALLY: {breakdown} "
+                f"(unparsed: {tally['unparsed']}; weighted score: {tally['weighted_score']})"
+            )
         
         task = self.task_system.create_voting_coordination_task(
             agents['voting_announcement'],
@@ -646,9 +1044,10 @@ class AutoPolicyDeliberationSystem:
         
         result = crew.kickoff()
         self.deliberation_results['final_announcement'] = result
+        self._publish('final_announcement', 'voting_announcement', result)
         
-        print("\n✅ Final Announcement Complete")
-        print("="*80 + "\n")
+        logger.info("\n✅ Final Announcement Complete")
+        logger.info("="*80 + "\n")
         
         return result
     
@@ -658,77 +1057,21 @@ class AutoPolicyDeliberationSystem:
         
         Compile all results into a final decision document
         """
-        print("\n" + "="*80)
-        print("PHASE 8: GENERATING FINAL SUMMARY REPORT")
-        print("="*80 + "\n")
-        
-        report = []
-        report.append("="*80)
-        report.append("POLICY DELIBERATION FINAL REPORT")
-        report.append("="*80)
-        report.append(f"\nPolicy Topic: {policy_topic}")
-        report.append(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"Total Experts: {len([k for k in self.deliberation_results.get('research', {}).keys()])}")
-        report.append("\n" + "="*80)
-        
-        # Section 1: Problem Statement
-        report.append("\n\n📋 SECTION 1: PROBLEM STATEMENT")
-        report.append("="*80)
-        if 'problem_statement' in self.deliberation_results:
-            report.append(str(self.deliberation_results['problem_statement']))
-        
-        # Section 2: Research Findings Summary
-        report.append("\n\n📊 SECTION 2: KEY RESEARCH FINDINGS")
-        report.append("="*80)
-        if 'research' in self.deliberation_results:
-            for role, result in self.deliberation_results['research'].items():
-                report.append(f"\n{role.replace('_', ' ').title()}:")
-                report.append("-" * 80)
-                report.append(str(result)[:500] + "..." if len(str(result)) > 500 else str(result))
-        
-        # Section 3: Debate Synthesis
-        report.append("\n\n💬 SECTION 3: DEBATE SYNTHESIS")
-        report.append("="*80)
-        if 'debate' in self.deliberation_results:
-            report.append(f"\nTotal Debate Contributions: {len(self.deliberation_results['debate'])}")
-            report.append("\nKey Arguments Presented:")
-            for role, result in self.deliberation_results['debate'].items():
-                report.append(f"\n• {role.replace('_', ' ').title()}")
-        
-        # Section 4: Voting Results
-        report.append("\n\n🗳️  SECTION 4: VOTING RESULTS")
-        report.append("="*80)
-        if 'voting' in self.deliberation_results:
-            report.append(f"\nTotal Votes Cast: {len(self.deliberation_results['voting'])}")
-            report.append("\nIndividual Votes:")
-            for role, result in self.deliberation_results['voting'].items():
-                report.append(f"\n{role.replace('_', ' ').title()}:")
-                report.append(str(result)[:300] + "..." if len(str(result)) > 300 else str(result))
-        
-        # Section 5: Final Decision
-        report.append("\n\n⚖️  SECTION 5: FINAL DECISION")
-        report.append("="*80)
-        if 'final_announcement' in self.deliberation_results:
-            report.append(str(self.deliberation_results['final_announcement']))
-        
-        # Section 6: Conclusion
-        report.append("\n\n✅ SECTION 6: CONCLUSION")
-        report.append("="*80)
-        report.append("\nThis comprehensive policy deliberation involved multi-expert analysis,")
-        report.append("structured debate, and democratic voting to reach an evidence-based decision.")
-        report.append("\n" + "="*80)
-        report.append("END OF REPORT")
-        report.append("="*80 + "\n")
-        
-        full_report = "\n".join(report)
+        self.current_phase = "final_report"
+        logger.info("\n" + "="*80)
+        logger.info("PHASE 8: GENERATING FINAL SUMMARY REPORT")
+        logger.info("="*80 + "\n")
+        
+        now = datetime.now()
+        full_report = _build_report(self.deliberation_results, policy_topic, now)
         
         # Save report to file
-        report_filename = f"policy_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        report_filename = f"policy_report_{now.strftime('%Y%m%d_%H%M%S')}.txt"
         with open(report_filename, 'w', encoding='utf-8') as f:
             f.write(full_report)
         
-        print(f"✅ Final report saved to: {report_filename}")
-        print("="*80 + "\n")
+        logger.info(f"✅ Final report saved to: {report_filename}")
+        logger.info("="*80 + "\n")
         
         return full_report
     
@@ -753,9 +1096,9 @@ class AutoPolicyDeliberationSystem:
         Returns:
             Complete deliberation results including final report
         """
-        print("\n" + "🚀"*40)
-        print("STARTING FULL POLICY DELIBERATION WORKFLOW")
-        print("🚀"*40 + "\n")
+        logger.info("\n" + "🚀"*40)
+        logger.info("STARTING FULL POLICY DELIBERATION WORKFLOW")
+        logger.info("🚀"*40 + "\n")
         
         start_time = datetime.now()
         
@@ -787,15 +1130,15 @@ class AutoPolicyDeliberationSystem:
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
             
-            print("\n" + "🎉"*40)
-            print("DELIBERATION COMPLETE!")
-            print("🎉"*40)
-            print(f"\nTotal Duration: {duration:.2f} seconds")
-            print(f"Total Experts: {len(agents)}")
-            print(f"Research Reports: {len(research_results)}")
-            print(f"Debate Contributions: {len(debate_results)}")
-            print(f"Votes Cast: {len(voting_results)}")
-            print("\n" + "="*80 + "\n")
+            logger.info("\n" + "🎉"*40)
+            logger.info("DELIBERATION COMPLETE!")
+            logger.info("🎉"*40)
+            logger.info(f"\nTotal Duration: {duration:.2f} seconds")
+            logger.info(f"Total Experts: {len(agents)}")
+            logger.info(f"Research Reports: {len(research_results)}")
+            logger.info(f"Debate Contributions: {len(debate_results)}")
+            logger.info(f"Votes Cast: {len(voting_results)}")
+            logger.info("\n" + "="*80 + "\n")
             
             return {
                 'agents': agents,
@@ -805,10 +1148,17 @@ class AutoPolicyDeliberationSystem:
             }
             
         except Exception as e:
-            print(f"\n❌ ERROR DURING DELIBERATION: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return None
+            traceback_id = _store_traceback(traceback.format_exc())
+            logger.error(
+                f"\n❌ ERROR DURING DELIBERATION in phase '{self.current_phase}': "
+                f"{type(e).__name__}: {e} (traceback_id={traceback_id})"
+            )
+            return {
+                'error': str(e),
+                'error_type': type(e).__name__,
+                'phase': self.current_phase,
+                'traceback_id': traceback_id
+            }
 
 
 # ========== MAIN EXECUTION ==========
@@ -818,9 +1168,10 @@ def interactive_mode():
     Interactive mode with user prompts for policy parameters
     Similar to parliament crew example
     """
-    print("\n" + "="*80)
-    print("## Welcome to the Auto-Coder Policy Deliberation System")
-    print("="*80)
+    logger.info("\n" + "="*80)
+    logger.info("## Welcome to the Auto-Coder Policy Deliberation System")
+    logger.info("="*80)
+    _stop_console_queue()
     
     # Gather user inputs
     policy_topic = input(
@@ -887,22 +1238,24 @@ def interactive_mode():
     )
     
     # Execute deliberation
-    print(f"\n{'='*80}")
-    print(f"Starting {execution_mode.upper()} mode deliberation...")
-    print(f"{'='*80}\n")
+    logger.info(f"\n{'='*80}")
+    logger.info(f"Starting {execution_mode.upper()} mode deliberation...")
+    logger.info(f"{'='*80}\n")
     
     results = system.kickoff(inputs={"mode": execution_mode})
     
     # Display results
-    print("\n\n" + "="*80)
-    print("## DELIBERATION COMPLETE")
-    print("="*80 + "\n")
-    
-    if "final_report" in results:
-        print("📄 Final Report Generated")
-        print(f"Mode: {results.get('mode', 'unknown')}")
+    logger.info("\n\n" + "="*80)
+    logger.info("## DELIBERATION COMPLETE")
+    logger.info("="*80 + "\n")
+    
+    if "error" in results:
+        logger.error(f"❌ Deliberation failed during {results['phase']}: {results['error']}")
+    elif "final_report" in results:
+        logger.info("📄 Final Report Generated")
+        logger.info(f"Mode: {results.get('mode', 'unknown')}")
         if 'duration_seconds' in results:
-            print(f"Duration: {results['duration_seconds']:.2f} seconds")
+            logger.info(f"Duration: {results['duration_seconds']:.2f} seconds")
     
     return results
 
@@ -926,12 +1279,12 @@ def register_with_agentverse(system: AutoPolicyDeliberationSystem,
         Registration result with agent address
     """
     if not UAGENTS_AVAILABLE:
-        print("❌ uAgents adapter not available. Cannot register with Agentverse.")
+        logger.error("❌ uAgents adapter not available. Cannot register with Agentverse.")
         return None
     
-    print(f"\n{'='*80}")
-    print("REGISTERING WITH AGENTVERSE")
-    print(f"{'='*80}\n")
+    logger.info(f"\n{'='*80}")
+    logger.info("REGISTERING WITH AGENTVERSE")
+    logger.info(f"{'='*80}\n")
     
     # Create registration tool
     register_tool = CrewaiRegisterTool()
@@ -985,20 +1338,42 @@ def register_with_agentverse(system: AutoPolicyDeliberationSystem,
     # Extract agent address
     if isinstance(result, dict) and "address" in result:
         agent_address = result["address"]
-        print(f"✅ Successfully registered with Agentverse!")
-        print(f"Agent Address: {agent_address}")
-        print(f"Agent Name: {agent_name}")
-        print(f"Port: {port}")
-        print(f"Mailbox: {'Enabled' if mailbox else 'Disabled'}")
+        logger.info("✅ Successfully registered with Agentverse!")
+        logger.info(f"Agent Address: {agent_address}")
+        logger.info(f"Agent Name: {agent_name}")
+        logger.info(f"Port: {port}")
+        logger.info(f"Mailbox: {'Enabled' if mailbox else 'Disabled'}")
     else:
-        print(f"⚠️  Registration result: {result}")
+        logger.warning(f"⚠️  Registration result: {result}")
     
-    print(f"\n{'='*80}\n")
+    logger.info(f"\n{'='*80}\n")
     
     return result
 
 
-def main():
+# Command line interface, built once at import
+_PARSER = argparse.ArgumentParser(description="Auto-Coder Policy Deliberation System")
+_PARSER.add_argument("--interactive", "-i", action="store_true", 
+                     help="Run in interactive mode with user prompts")
+_PARSER.add_argument("--register", "-r", action="store_true",
+                     help="Register with Agentverse (requires AV_API_KEY)")
+_PARSER.add_argument("--mode", "-m", choices=["full", "quick", "research", "debate"],
+                     default="full", help="Execution mode")
+_PARSER.add_argument("--policy", "-p", type=str,
+                     help="Policy topic to analyze")
+_PARSER.add_argument("--port", type=int, default=8034,
+                     help="Port for Agentverse registration")
+_PARSER.add_argument("--max-parallel-agents", type=int, default=8,
+                     help="Experts run concurrently within a phase")
+_PARSER.add_argument("--timeout", type=float, default=None,
+                     help="Per-phase timeout in seconds for parallel phases")
+_PARSER.add_argument("--fail-fast", action="store_true",
+                     help="Abort on the first agent failure")
+_PARSER.add_argument("--max-context-chars", type=int, default=8000,
+                     help="Character budget for digests fed to voting/announcement")
+
+
+def main(argv: Optional[List[str]] = None):
     """
     Main execution function with multiple modes
     
@@ -1006,26 +1381,11 @@ def main():
     1. Interactive mode (user prompts)
     2. Direct execution (programmatic)
     3. Agentverse registration (with API token)
-    """
     
-    # Load environment variables
-    load_dotenv()
-    
-    # Check for command line arguments
-    import argparse
-    parser = argparse.ArgumentParser(description="Auto-Coder Policy Deliberation System")
-    parser.add_argument("--interactive", "-i", action="store_true", 
-                       help="Run in interactive mode with user prompts")
-    parser.add_argument("--register", "-r", action="store_true",
-                       help="Register with Agentverse (requires AV_API_KEY)")
-    parser.add_argument("--mode", "-m", choices=["full", "quick", "research", "debate"],
-                       default="full", help="Execution mode")
-    parser.add_argument("--policy", "-p", type=str,
-                       help="Policy topic to analyze")
-    parser.add_argument("--port", type=int, default=8034,
-                       help="Port for Agentverse registration")
-    
-    args = parser.parse_args()
+    Args:
+        argv: Optional argument list (defaults to sys.argv[1:])
+    """
+    args = _PARSER.parse_args(argv)
     
     # Interactive mode
     if args.interactive:
@@ -1035,8 +1395,8 @@ def main():
     if args.register:
         api_token = os.getenv("AV_API_KEY")
         if not api_token:
-            print("❌ Error: AV_API_KEY not found in environment")
-            print("Please set AV_API_KEY in your .env file for Agentverse registration")
+            logger.error("❌ Error: AV_API_KEY not found in environment")
+            logger.info("Please set AV_API_KEY in your .env file for Agentverse registration")
             return None
         
         # Create system instance
@@ -1053,14 +1413,14 @@ def main():
         
         # Keep running for async requests
         if result:
-            print("Agent is now running and listening for requests...")
-            print("Press Ctrl+C to stop")
+            logger.info("Agent is now running and listening for requests...")
+            logger.info("Press Ctrl+C to stop")
             try:
                 import time
                 while True:
                     time.sleep(1)
             except KeyboardInterrupt:
-                print("\n\nShutting down agent...")
+                logger.info("\n\nShutting down agent...")
         
         return result
     
@@ -1101,7 +1461,11 @@ def main():
     # Initialize system
     system = AutoPolicyDeliberationSystem(
         policy_topic=policy_topic,
-        background_context=background_context
+        background_context=background_context,
+        max_parallel_agents=args.max_parallel_agents,
+        timeout_seconds=args.timeout,
+        fail_fast=args.fail_fast,
+        max_context_chars=args.max_context_chars
     )
     
     # Execute based on mode
@@ -1114,20 +1478,22 @@ def main():
     
     execution_mode = mode_map.get(args.mode, "full")
     
-    print(f"\nPolicy Topic: {policy_topic}")
-    print(f"Execution Mode: {execution_mode.upper()}\n")
-    print("Starting automated multi-expert deliberation...\n")
+    logger.info(f"\nPolicy Topic: {policy_topic}")
+    logger.info(f"Execution Mode: {execution_mode.upper()}\n")
+    logger.info("Starting automated multi-expert deliberation...\n")
     
     results = system.kickoff(inputs={"mode": execution_mode})
     
-    if results:
-        print("\n✅ Deliberation completed successfully!")
+    if results and 'error' not in results:
+        logger.info("\n✅ Deliberation completed successfully!")
         if 'final_report' in results:
-            print(f"📄 Final report available")
+            logger.info("📄 Final report available")
         if 'duration_seconds' in results:
-            print(f"⏱️  Total time: {results['duration_seconds']:.2f} seconds")
+            logger.info(f"⏱️  Total time: {results['duration_seconds']:.2f} seconds")
     else:
-        print("\n❌ Deliberation failed. Check error messages above.")
+        logger.error("\n❌ Deliberation failed. Check error messages above.")
+        if results and results.get('traceback_id'):
+            logger.error(get_traceback(results['traceback_id']))
     
     return results
 
@@ -1179,7 +1545,8 @@ if __name__ == "__main__":
     - AV_API_KEY: Required only for Agentverse registration
     """
     
-    print("""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("""
     ╔════════════════════════════════════════════════════════════════════════════╗
     ║                                                                            ║
     ║         AUTO-CODER POLICY DELIBERATION SYSTEM v2.0                        ║
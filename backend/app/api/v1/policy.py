@@ -1,7 +1,8 @@
 """
 Policy API Routes
 """
-from fastapi import APIRouter, HTTPException
+import hashlib
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
@@ -28,6 +29,35 @@ class PolicyResponse(BaseModel):
     created_at: str
     updated_at: str
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches etag
+    
+    Uses weak comparison (RFC 9110 section 13.1.2): the header may list
+    several tags or be "*", and a W/ prefix (added by proxies that weaken
+    ETags) is ignored.
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+def _to_response(session) -> PolicyResponse:
+    """Build the API response model from a PolicySession"""
+    return PolicyResponse(
+        session_id=session.session_id,
+        policy_topic=session.policy_topic,
+        background_context=session.background_context,
+        status=session.status,
+        current_phase=session.current_phase,
+        phase_name=session.phase_name,
+        created_at=session.created_at,
+        updated_at=session.updated_at
+    )
+
 @router.post("/create", response_model=PolicyResponse)
 async def create_policy(policy: PolicyCreate):
     """
@@ -47,21 +77,15 @@ async def create_policy(policy: PolicyCreate):
         'interests': policy.interests
     })
     
-    return PolicyResponse(
-        session_id=session.session_id,
-        policy_topic=session.policy_topic,
-        background_context=session.background_context,
-        status=session.status,
-        current_phase=session.current_phase,
-        phase_name=session.phase_name,
-        created_at=session.created_at,
-        updated_at=session.updated_at
-    )
+    return _to_response(session)
 
-@router.post("/start/{session_id}")
+@router.post("/start/{session_id}", status_code=202)
 async def start_deliberation(session_id: str):
     """
-    Start the deliberation process for a session
+    Queue the deliberation process for a session
+    
+    The deliberation runs in the background; progress and completion are
+    delivered over WebSocket events for the session.
     """
     from app.services import policy_service as ps_module
     
@@ -69,14 +93,20 @@ async def start_deliberation(session_id: str):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
+    if session.status in ('queued', 'running'):
+        raise HTTPException(status_code=409, detail=f"Deliberation already {session.status}")
+    
     await ps_module.policy_service.start_deliberation(session_id)
     
-    return {"message": "Deliberation started", "session_id": session_id}
+    return {"message": "Deliberation queued", "session_id": session_id, "status": session.status}
 
 @router.get("/session/{session_id}", response_model=PolicyResponse)
-async def get_session(session_id: str):
+async def get_session(session_id: str, request: Request, response: Response):
     """
     Get session details
+    
+    Responses carry an ETag so polling clients can revalidate with
+    If-None-Match and receive 304 Not Modified while nothing has changed.
     """
     from app.services import policy_service as ps_module
     
@@ -84,36 +114,30 @@ async def get_session(session_id: str):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    return PolicyResponse(
-        session_id=session.session_id,
-        policy_topic=session.policy_topic,
-        background_context=session.background_context,
-        status=session.status,
-        current_phase=session.current_phase,
-        phase_name=session.phase_name,
-        created_at=session.created_at,
-        updated_at=session.updated_at
-    )
+    etag = '"' + hashlib.md5(
+        f"{session.updated_at}|{session.current_phase}|{session.status}".encode()
+    ).hexdigest() + '"'
+    cache_headers = {"ETag": etag, "Cache-Control": "no-cache, must-revalidate"}
+    
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers)
+    
+    response.headers.update(cache_headers)
+    return _to_response(session)
 
 @router.get("/sessions", response_model=List[PolicyResponse])
-async def list_sessions():
+async def list_sessions(
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0)
+):
     """
-    List all policy sessions
+    List policy sessions (paged)
+    
+    Sessions live in the service's in-memory store, so lookups never block
+    the event loop; paging keeps the response size bounded.
     """
     from app.services import policy_service as ps_module
     
-    sessions = ps_module.policy_service.list_sessions()
-    
-    return [
-        PolicyResponse(
-            session_id=s.session_id,
-            policy_topic=s.policy_topic,
-            background_context=s.background_context,
-            status=s.status,
-            current_phase=s.current_phase,
-            phase_name=s.phase_name,
-            created_at=s.created_at,
-            updated_at=s.updated_at
-        )
-        for s in sessions
-    ]
+    sessions = ps_module.policy_service.list_sessions(limit=limit, offset=offset)
+    
+    return [_to_response(s) for s in sessions]
@@ -0,0 +1,28 @@
+"""
+Shared ASI Cloud configuration
+Read once at import so a missing key fails at startup, not mid-deliberation
+"""
+
+import os
+from typing import Final
+
+ASI_BASE_URL: Final[str] = "https://inference.asicloud.cudos.org/v1"
+
+try:
+    ASI_API_KEY: Final[str] = os.environ["ASI_API_KEY"]
+except KeyError:
+    raise RuntimeError(
+        "ASI_API_KEY is not set - add it to the environment or backend/.env"
+    ) from None
+
+# Stream completions from ASI Cloud (ASI_STREAM=0 to disable)
+ASI_STREAM: Final[bool] = os.environ.get("ASI_STREAM", "1").lower() not in ("0", "false", "no")
+
+# Instructions every expert shares, taken from the task templates that
+# already repeat them. Kept byte-identical and placed first in each
+# backstory so the provider's prefix cache can reuse it across agents
+SHARED_PRELUDE: Final[str] = (
+    "Provide policy analysis in natural language - NOT code or programming "
+    "examples! DO NOT output code, programming syntax, or unrelated content. "
+    "Be thorough, objective, and evidence-based.\n\n"
+)
@@ -3,34 +3,56 @@ Custom LLM Wrapper for ASI Cloud
 Bypasses CrewAI's model name modification
 """
 
-import os
+import atexit
+import importlib.util
 from typing import Any, Dict, List, Optional
+import httpx
+import litellm
 from openai import OpenAI
 from crewai.llm import LLM
+from ._config import ASI_API_KEY, ASI_BASE_URL, ASI_STREAM
+
+
+# One pooled HTTP client for every LLM call in the process, so the agents
+# reuse keep-alive connections to ASI Cloud instead of each opening their own
+_SHARED_CLIENT = httpx.Client(
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=httpx.Timeout(60.0, connect=5.0),
+    http2=importlib.util.find_spec("h2") is not None,
+)
+litellm.client_session = _SHARED_CLIENT
+atexit.register(_SHARED_CLIENT.close)
 
 
 def create_asi_cloud_llm(model: str = "openai/gpt-oss-20b", temperature: float = 0.4):
     """
     Create a CrewAI-compatible LLM configured for ASI Cloud
     
-    This uses CrewAI's native LLM class but forces the correct model name
-    by monkeypatching the completion parameters
+    This uses CrewAI's native LLM class; base_url and api_key are passed to
+    the constructor, so the client is configured before any request is made
     """
     # Create the LLM instance with ASI Cloud config
     llm = LLM(
         model=model,  # This will be sent AS-IS to the API
         temperature=temperature,
-        api_key=os.environ.get("ASI_API_KEY"),
-        base_url="https://inference.asicloud.cudos.org/v1"
+        api_key=ASI_API_KEY,
+        base_url=ASI_BASE_URL,
+        stream=ASI_STREAM
     )
     
     # Store the original model name to preserve it
     llm._original_model = model
     
-    # Monkeypatch the internal client if it exists
-    if hasattr(llm, 'client') and llm.client:
-        # Force the client to use our base_url and API key
-        llm.client.base_url = "https://inference.asicloud.cudos.org/v1"
-        llm.client.api_key = os.environ.get("ASI_API_KEY")
-    
     return llm
+
+
+def warm_connection() -> None:
+    """Open a pooled TLS connection to ASI Cloud ahead of the first agent call"""
+    try:
+        _SHARED_CLIENT.get(
+            f"{ASI_BASE_URL}/models",
+            headers={"Authorization": f"Bearer {ASI_API_KEY}"},
+        )
+    except httpx.HTTPError:
+        # Best effort; the first real request will simply connect itself
+        pass
@@ -4,51 +4,213 @@ Connects real AI agents to the web application for live visualization
 """
 
 import asyncio
+import functools
+import itertools
+import os
+import re
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Dict, Any, Optional, Callable
-from crewai import Crew, Process
+from typing import Dict, Any, List, Optional, Callable
+from crewai import Task
 import logging
 
 from .agent_system import DecisionAgentSystem
 from .task_system import AgentTaskSystem
 from .output_validator import OutputValidator
+from .semantic_cache import make_scope, scoped
 
 logger = logging.getLogger(__name__)
 
 
+def _run_scoped(scope: Optional[str], fn: Callable):
+    """Call fn on a worker thread under the given semantic cache scope"""
+    with scoped(scope):
+        return fn()
+
+
+async def _gather_or_cancel(coros) -> list:
+    """
+    Run coroutines concurrently; on the first failure cancel and await the rest
+    
+    Unlike a bare gather, no sibling keeps calling the LLM or emitting
+    events for a deliberation that has already failed.
+    """
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _truncate(result: Any, n: int = 500) -> str:
+    """Preview of a task result for WebSocket events"""
+    # TaskOutput.raw is the bare text; avoids stringifying token metadata
+    raw = getattr(result, 'raw', None)
+    if isinstance(raw, str):
+        return raw[:n]
+    return str(result)[:n]
+
+# Agreement / disagreement cues used by the consensus heuristic
+_AGREE_RE = re.compile(r'\b(agree|support|concur|consensus|aligned|correct)\b', re.IGNORECASE)
+_DISAGREE_RE = re.compile(r'\b(disagree|oppose|against|however|but|contrary)\b', re.IGNORECASE)
+
+# Debate prompt scaffolding, filled per agent with the round's context
+_DEBATE_TEMPLATE = textwrap.dedent("""
+    **Round {round_num} Debate on: {policy_topic}**
+    
+    Previous Arguments from Other Experts:
+    {context}
+    
+    Your Task:
+    1. Consider the arguments presented by other experts above
+    2. Identify points of agreement and disagreement
+    3. Present YOUR perspective on {policy_topic}
+    4. Respond to arguments you disagree with (provide counter-arguments)
+    5. Build upon arguments you agree with (provide supporting evidence)
+    6. Propose synthesis or compromise positions where appropriate
+    
+    Be specific, evidence-based, and engage directly with others' points.
+    """)
+
+
+@dataclass(slots=True)
+class DeliberationResults:
+    """Outputs collected across the phases of one deliberation run"""
+    problem_statement: str = ''
+    research: Dict[str, Any] = field(default_factory=dict)
+    debate: Dict[str, Any] = field(default_factory=dict)
+    voting: Dict[str, Any] = field(default_factory=dict)
+    final_decision: str = 'Unknown'
+    final_announcement: str = ''
+    final_report: Optional[Dict[str, Any]] = None
+
+
 class IntegratedDeliberationSystem:
     """
     Real-time policy deliberation system with WebSocket event streaming
     Manages 26+ expert agents through all deliberation phases
     """
     
-    def __init__(self, event_emitter: Optional[Callable] = None):
+    # Agents built ahead of the rest so phase 2 can start immediately
+    PRIORITY_AGENTS = frozenset({'problem_statement'})
+    
+    # Specialised research task per agent id; unlisted agents get the generic task
+    RESEARCH_TASK_FACTORIES = {
+        # Economic
+        "economic": "create_economic_analysis_task",
+        "economic_macro": "create_economic_analysis_task",
+        "economic_micro": "create_economic_analysis_task",
+        
+        # Social welfare
+        "social": "create_social_welfare_task",
+        "healthcare_welfare": "create_social_welfare_task",
+        "education_welfare": "create_social_welfare_task",
+        "housing_welfare": "create_social_welfare_task",
+        
+        # Geospatial & demographic
+        "geospatial": "create_geospatial_demographic_task",
+        "geographic_poverty": "create_geospatial_demographic_task",
+        "demographic_policy": "create_geospatial_demographic_task",
+        
+        # Income inequality
+        "income": "create_income_inequality_task",
+        "inequality_causes": "create_income_inequality_task",
+        "income_redistribution": "create_income_inequality_task",
+        "inequality_impact": "create_income_inequality_task",
+        
+        # Resource allocation
+        "resource": "create_resource_allocation_task",
+        "resource_access": "create_resource_allocation_task",
+        "resource_optimization": "create_resource_allocation_task",
+        "realtime_allocation": "create_resource_allocation_task",
+        "system_efficiency": "create_resource_allocation_task",
+        
+        # Adaptation & monitoring
+        "policy_monitoring": "create_adaptation_feedback_task",
+        "adaptive_policy": "create_adaptation_feedback_task",
+        
+        # Legal
+        "legal": "create_legal_compliance_task",
+    }
+    
+    def __init__(self, event_emitter: Optional[Callable] = None, max_parallel_agents: Optional[int] = None):
         """
         Initialize the deliberation system
         
         Args:
             event_emitter: Async function to emit WebSocket events
                           signature: async def emit(event: str, data: dict, session_id: str)
+            max_parallel_agents: Agents allowed to run at once (tune to the LLM
+                                 provider's rate limit); defaults to the
+                                 KAZIWIZ_AGENT_CONCURRENCY env var, else 8
         """
         self.agent_system = DecisionAgentSystem()
         self.task_system = AgentTaskSystem()
         self.event_emitter = event_emitter
+        self.max_parallel_agents = max_parallel_agents or int(os.getenv("KAZIWIZ_AGENT_CONCURRENCY", "8"))
+        
+        # Dedicated worker threads for blocking crew runs. Its size is the one
+        # bound on concurrent agents: phases fan out freely and runs beyond
+        # the LLM budget queue here instead of in the default pool
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_parallel_agents,
+            thread_name_prefix="crew"
+        )
+        
         self.agents = {}
-        self.results = {}
+        self.results = DeliberationResults()
+        
+        # Display label per agent id, filled in by initialize_agents
+        self._agent_labels: Dict[str, str] = {}
+        
+        # Speakers that run the deliberation rather than take part in it
+        self._orchestration_ids = frozenset({'problem_statement', 'turn_management', 'voting_announcement'})
+        self._domain_experts: List[str] = []
         
         logger.info("🚀 Integrated Deliberation System initialized")
     
     async def emit_event(self, event: str, data: dict, session_id: str):
-        """Emit WebSocket event if emitter is available"""
-        if self.event_emitter:
-            try:
-                logger.info(f"🔔 Emitting '{event}' to session {session_id}")
-                await self.event_emitter(event, data, session_id)
-                logger.info(f"✅ Emitted '{event}' successfully")
-            except Exception as e:
-                logger.error(f"❌ Error emitting event {event}: {e}", exc_info=True)
-        else:
-            logger.warning(f"⚠️ No event emitter - cannot emit '{event}'")
+        """
+        Hand a WebSocket event to the emitter
+        
+        The emitter is PolicyService.emit_event, which only enqueues into its
+        batch window, so phases never wait on a WebSocket write.
+        """
+        if not self.event_emitter:
+            logger.warning("⚠️ No event emitter - cannot emit '%s'", event)
+            return
+        
+        try:
+            await self.event_emitter(event, data, session_id)
+        except Exception as e:
+            logger.error("❌ Error emitting event %s: %s", event, e, exc_info=True)
+    
+    async def _run_task(self, agent, task: Task, scope: Optional[str] = None):
+        """
+        Run a single agent task on the crew executor
+        
+        Single-agent, single-task runs go straight through Task.execute_sync,
+        skipping the Crew construction and orchestration overhead. scope
+        (see semantic_cache.make_scope) limits which cached responses the
+        agent may be answered from; without one the task runs uncached.
+        """
+        cfut = self._executor.submit(
+            _run_scoped, scope, functools.partial(task.execute_sync, agent=agent)
+        )
+        fut = asyncio.wrap_future(cfut)
+        try:
+            return await asyncio.shield(fut)
+        except asyncio.CancelledError:
+            # A started crew run can't be interrupted; wait it out so a
+            # cancelled phase never overlaps the next run on shared agents
+            if not cfut.cancel():
+                await asyncio.gather(fut, return_exceptions=True)
+            raise
     
     async def run_deliberation(
         self,
@@ -69,6 +231,7 @@ class IntegratedDeliberationSystem:
         7. Final Report - Generate comprehensive summary
         """
         start_time = datetime.now()
+        self.results = DeliberationResults()
         
         try:
             # PHASE 1: Initialization
@@ -78,16 +241,29 @@ class IntegratedDeliberationSystem:
                 'message': 'Initializing all expert agents...'
             }, session_id)
             
-            agents = await self.initialize_agents(session_id)
-            
-            await self.emit_event('phase_completed', {
-                'phase': 1,
-                'phase_name': 'Initialization',
-                'agent_count': len(agents)
-            }, session_id)
+            # Only the problem statement agent gates phase 2; the rest are
+            # built in the background while it runs
+            self.agents = {}
+            priority_task = asyncio.create_task(self._init_priority_agents(session_id))
+            rest_task = asyncio.create_task(self._init_remaining_agents(session_id))
             
-            # PHASE 2: Problem Statement
-            await self.phase_problem_statement(session_id, agents, policy_topic, background_context)
+            try:
+                priority = await priority_task
+                
+                # Phase 1 ends here so the frontend sees the phases in order;
+                # the remaining agents are merged in once phase 2 is done
+                await self.emit_event('phase_completed', {
+                    'phase': 1,
+                    'phase_name': 'Initialization',
+                    'agent_count': len(self.agent_system.get_all_agent_definitions())
+                }, session_id)
+                
+                # PHASE 2: Problem Statement
+                await self.phase_problem_statement(session_id, priority, policy_topic, background_context)
+            except BaseException:
+                rest_task.cancel()
+                raise
+            agents = self._merge_agents(priority, await rest_task)
             
             # PHASE 3: Research
             await self.phase_research(session_id, agents, policy_topic)
@@ -110,17 +286,17 @@ class IntegratedDeliberationSystem:
                 'session_id': session_id,
                 'duration_seconds': duration,
                 'total_agents': len(agents),
-                'final_decision': self.results.get('final_decision', 'Unknown')
+                'final_decision': self.results.final_decision
             }, session_id)
             
             return {
                 'success': True,
                 'duration': duration,
-                'results': self.results
+                'results': asdict(self.results)
             }
             
         except Exception as e:
-            logger.error(f"Deliberation error: {e}", exc_info=True)
+            logger.error("Deliberation error: %s", e, exc_info=True)
             await self.emit_event('deliberation_error', {
                 'error': str(e),
                 'phase': 'Unknown'
@@ -132,76 +308,64 @@ class IntegratedDeliberationSystem:
     
     async def initialize_agents(self, session_id: str) -> Dict[str, Any]:
         """Phase 1: Initialize all 26+ expert agents"""
-        agents = {}
-        agent_definitions = self.agent_system.get_all_agent_definitions()
-        
-        # Mapping of agent IDs to method names
-        method_map = {
-            # Orchestration
-            "problem_statement": "problem_statement_expert",
-            "turn_management": "turn_management_expert",
-            "voting_announcement": "voting_announcement_expert",
-            
-            # Core
-            "economic": "economic_agent",
-            "social": "social_agent",
-            "geospatial": "geospatial_agent",
-            "income": "income_agent",
-            "resource": "resource_agent",
-            "legal": "legal_agent",
-            
-            # Economic MoE
-            "economic_macro": "macro_economic_expert",
-            "economic_micro": "micro_economic_expert",
-            "policy_impact": "policy_impact_expert",
-            "trade_investment": "trade_investment_expert",
-            
-            # Social MoE
-            "healthcare_welfare": "healthcare_welfare_expert",
-            "education_welfare": "education_welfare_expert",
-            "housing_welfare": "housing_welfare_expert",
-            
-            # Geospatial MoE
-            "geographic_poverty": "geographic_poverty_expert",
-            "demographic_policy": "demographic_policy_expert",
-            "resource_access": "resource_access_expert",
-            
-            # Income MoE
-            "inequality_causes": "inequality_causes_expert",
-            "income_redistribution": "income_redistribution_expert",
-            "inequality_impact": "inequality_impact_expert",
-            
-            # Resource MoE
-            "resource_optimization": "resource_optimization_expert",
-            "realtime_allocation": "realtime_allocation_expert",
-            "system_efficiency": "system_efficiency_expert",
-            
-            # Feedback MoE
-            "policy_monitoring": "policy_monitoring_expert",
-            "adaptive_policy": "adaptive_policy_expert",
-        }
-        
-        for agent_def in agent_definitions:
-            agent_id = agent_def['id']
-            
+        priority = await self._init_priority_agents(session_id)
+        return self._merge_agents(priority, await self._init_remaining_agents(session_id))
+    
+    async def _init_priority_agents(self, session_id: str) -> Dict[str, Any]:
+        """Build just the agents the problem statement phase needs"""
+        definitions = [d for d in self.agent_system.get_all_agent_definitions()
+                       if d['id'] in self.PRIORITY_AGENTS]
+        return await self._init_agents(session_id, definitions)
+    
+    async def _init_remaining_agents(self, session_id: str) -> Dict[str, Any]:
+        """Build every other agent off the event loop"""
+        definitions = [d for d in self.agent_system.get_all_agent_definitions()
+                       if d['id'] not in self.PRIORITY_AGENTS]
+        return await self._init_agents(session_id, definitions, in_thread=True)
+    
+    def _merge_agents(self, *batches: Dict[str, Any]) -> Dict[str, Any]:
+        """Install the built batches as self.agents and index the experts"""
+        built = {}
+        for batch in batches:
+            built.update(batch)
+        
+        # Keep definition order regardless of which batch built an agent
+        self.agents = {d['id']: built[d['id']]
+                       for d in self.agent_system.get_all_agent_definitions()
+                       if d['id'] in built}
+        self._domain_experts = [a for a in self.agents if a not in self._orchestration_ids]
+        logger.info("✅ Initialized %d agents", len(self.agents))
+        return self.agents
+    
+    async def _init_agents(self, session_id: str, definitions: List[Dict[str, Any]],
+                           in_thread: bool = False) -> Dict[str, Any]:
+        """Create agent instances for the given definitions and return them by id"""
+        for agent_def in definitions:
             # Emit agent creation event
             await self.emit_event('agent_created', {
-                'agent_id': agent_id,
+                'agent_id': agent_def['id'],
                 'agent_name': agent_def['name'],
                 'category': agent_def['category'],
                 'status': 'initialized'
             }, session_id)
-            
-            # Create agent instance using method map
-            method_name = method_map.get(agent_id)
-            if method_name and hasattr(self.agent_system, method_name):
-                agents[agent_id] = getattr(self.agent_system, method_name)()
-            else:
-                logger.warning(f"No method found for agent {agent_id}")
         
-        self.agents = agents
-        logger.info(f"✅ Initialized {len(agents)} agents")
-        return agents
+        def _build() -> Dict[str, Any]:
+            built = {}
+            for agent_def in definitions:
+                agent_id = agent_def['id']
+                # Create agent instance via the dispatch table
+                try:
+                    built[agent_id] = self.agent_system.get(agent_id)
+                except KeyError:
+                    logger.warning("No spec found for agent %s", agent_id)
+            return built
+        
+        # Agent construction is synchronous; the bulk batch goes to a thread
+        # so it overlaps with the problem statement phase
+        built = await asyncio.to_thread(_build) if in_thread else _build()
+        for agent_id in built:
+            self._agent_labels[agent_id] = agent_id.replace('_', ' ').title()
+        return built
     
     async def phase_problem_statement(
         self,
@@ -225,34 +389,28 @@ class IntegratedDeliberationSystem:
         }, session_id)
         
         task = self.task_system.create_problem_statement_task(agent, policy_topic, context)
-        crew = Crew(
-            agents=[agent],
-            tasks=[task],
-            process=Process.sequential,
-            verbose=False
-        )
-        
-        # Run in thread pool to avoid blocking
-        result = await asyncio.to_thread(crew.kickoff)
+        # Run on the crew executor to avoid blocking
+        result = await self._run_task(agent, task, make_scope(policy_topic, 'problem_statement'))
         result_str = str(result)
+        output_preview = _truncate(result)  # Truncate for WebSocket
         
-        # Validate output to prevent code hallucinations
-        is_valid, reason = OutputValidator.is_valid_policy_output(result_str)
+        # Validate output to prevent code hallucinations, cleaning up any
+        # code remnants when it passes
+        is_valid, reason, cleaned = OutputValidator.validate_and_extract(result_str)
         if not is_valid:
-            logger.warning(f"⚠️ Invalid output detected ({reason}), using fallback")
+            logger.warning("⚠️ Invalid output detected (%s), using fallback", reason)
             result_str = OutputValidator.create_fallback_response(
                 "Problem Statement Expert",
                 policy_topic
             )
         else:
-            # Try to clean up any code remnants
-            result_str = OutputValidator.extract_policy_content(result_str)
+            result_str = cleaned
         
-        self.results['problem_statement'] = result_str
+        self.results.problem_statement = result_str
         
         await self.emit_event('agent_completed', {
             'agent_id': 'problem_statement',
-            'output': str(result)[:500]  # Truncate for WebSocket
+            'output': output_preview
         }, session_id)
         
         await self.emit_event('phase_completed', {
@@ -266,7 +424,7 @@ class IntegratedDeliberationSystem:
             'phase': 3,
             'phase_name': 'Research & Analysis',
             'message': 'All experts conducting research...',
-            'total_agents': len([a for a in agents if a not in ['problem_statement', 'turn_management', 'voting_announcement']])
+            'total_agents': len(self._domain_experts)
         }, session_id)
         
         research_groups = {
@@ -279,70 +437,70 @@ class IntegratedDeliberationSystem:
             "Legal": ['legal']
         }
         
-        research_results = {}
-        completed_count = 0
-        total_count = sum(len(group) for group in research_groups.values())
+        research_jobs = [
+            (agent_id, group_name)
+            for group_name, agent_ids in research_groups.items()
+            for agent_id in agent_ids
+            if agent_id in agents
+        ]
         
-        for group_name, agent_ids in research_groups.items():
-            for agent_id in agent_ids:
-                if agent_id not in agents:
-                    continue
-                
-                await self.emit_event('agent_started', {
-                    'agent_id': agent_id,
-                    'agent_name': agent_id.replace('_', ' ').title(),
-                    'action': 'conducting research',
-                    'group': group_name
-                }, session_id)
-                
-                # Create appropriate task based on group
-                if 'economic' in agent_id.lower():
-                    task = self.task_system.create_economic_analysis_task(agents[agent_id], policy_topic)
-                elif 'social' in agent_id.lower() or 'healthcare' in agent_id.lower() or 'education' in agent_id.lower() or 'housing' in agent_id.lower():
-                    task = self.task_system.create_social_welfare_task(agents[agent_id], policy_topic)
-                elif 'geo' in agent_id.lower() or 'demographic' in agent_id.lower():
-                    task = self.task_system.create_geospatial_demographic_task(agents[agent_id], policy_topic)
-                elif 'income' in agent_id.lower() or 'inequality' in agent_id.lower():
-                    task = self.task_system.create_income_inequality_task(agents[agent_id], policy_topic)
-                elif 'resource' in agent_id.lower() or 'allocation' in agent_id.lower() or 'efficiency' in agent_id.lower():
-                    task = self.task_system.create_resource_allocation_task(agents[agent_id], policy_topic)
-                elif 'monitoring' in agent_id.lower() or 'adaptive' in agent_id.lower():
-                    task = self.task_system.create_adaptation_feedback_task(agents[agent_id], policy_topic)
-                elif 'legal' in agent_id.lower():
-                    task = self.task_system.create_legal_compliance_task(agents[agent_id], policy_topic)
-                else:
-                    task = self.task_system.create_research_task(agents[agent_id], policy_topic, agent_id.replace('_', ' ').title())
-                
-                crew = Crew(agents=[agents[agent_id]], tasks=[task], process=Process.sequential, verbose=False)
-                result = await asyncio.to_thread(crew.kickoff)
-                result_str = str(result)
-                
-                # Validate output to prevent code hallucinations
-                is_valid, reason = OutputValidator.is_valid_policy_output(result_str)
-                if not is_valid:
-                    logger.warning(f"⚠️ Agent {agent_id} generated invalid output ({reason}), using fallback")
-                    result_str = OutputValidator.create_fallback_response(
-                        agent_id.replace('_', ' ').title(),
-                        policy_topic
-                    )
-                else:
-                    result_str = OutputValidator.extract_policy_content(result_str)
-                
-                research_results[agent_id] = result_str
-                completed_count += 1
-                
-                await self.emit_event('agent_completed', {
-                    'agent_id': agent_id,
-                    'output': str(result)[:500],
-                    'progress': f"{completed_count}/{total_count}"
-                }, session_id)
+        # One slot per agent up front, in group order; each coroutine fills
+        # only its own key, so the fan-in needs no lock
+        research_results = dict.fromkeys(agent_id for agent_id, _ in research_jobs)
+        completed = itertools.count(1)
+        research_scope = make_scope(policy_topic, 'research')
+        denom = f"/{sum(len(group) for group in research_groups.values())}"
+        
+        async def _run_one_research(agent_id: str, group_name: str):
+            await self.emit_event('agent_started', {
+                'agent_id': agent_id,
+                'agent_name': self._agent_labels[agent_id],
+                'action': 'conducting research',
+                'group': group_name
+            }, session_id)
+            
+            # Create appropriate task based on the agent's specialty
+            factory_name = self.RESEARCH_TASK_FACTORIES.get(agent_id)
+            if factory_name:
+                task = getattr(self.task_system, factory_name)(agents[agent_id], policy_topic)
+            else:
+                task = self.task_system.create_research_task(agents[agent_id], policy_topic, self._agent_labels[agent_id])
+            
+            result = await self._run_task(agents[agent_id], task, research_scope)
+            result_str = str(result)
+            output_preview = _truncate(result)
+            
+            # Validate output to prevent code hallucinations
+            is_valid, reason, cleaned = OutputValidator.validate_and_extract(result_str)
+            if not is_valid:
+                logger.warning("⚠️ Agent %s generated invalid output (%s), using fallback", agent_id, reason)
+                result_str = OutputValidator.create_fallback_response(
+                    self._agent_labels[agent_id],
+                    policy_topic
+                )
+            else:
+                result_str = cleaned
+            
+            research_results[agent_id] = result_str
+            
+            await self.emit_event('agent_completed', {
+                'agent_id': agent_id,
+                'output': output_preview,
+                'progress': f"{next(completed)}{denom}"
+            }, session_id)
         
-        self.results['research'] = research_results
+        # Agents research independently, so fan them all out at once
+        await _gather_or_cancel([
+            _run_one_research(agent_id, group_name)
+            for agent_id, group_name in research_jobs
+        ])
+        
+        self.results.research = research_results
         
         await self.emit_event('phase_completed', {
             'phase': 3,
             'phase_name': 'Research & Analysis',
-            'completed_agents': completed_count
+            'completed_agents': len(research_jobs)
         }, session_id)
     
     async def phase_debate(self, session_id: str, agents: Dict, policy_topic: str):
@@ -353,10 +511,10 @@ class IntegratedDeliberationSystem:
             'message': 'Experts engaging in dynamic debate...'
         }, session_id)
         
-        domain_experts = [
-            a for a in agents.keys()
-            if a not in ['problem_statement', 'turn_management', 'voting_announcement']
-        ]
+        domain_experts = self._domain_experts
+        
+        # Progress suffix shared by every emit in the phase
+        denom = f"/{len(domain_experts)}"
         
         # Multi-round debate until consensus or max rounds
         max_rounds = 3
@@ -370,71 +528,62 @@ class IntegratedDeliberationSystem:
                 'message': f'Round {round_num}: Agents presenting arguments and rebuttals...'
             }, session_id)
             
-            round_arguments = {}
+            # Every agent in a round sees the same prior-round history, so the
+            # context is built once and the round runs in parallel
+            context = self._build_debate_context(debate_history, round_num)
+            task_description = _DEBATE_TEMPLATE.format(
+                round_num=round_num,
+                policy_topic=policy_topic,
+                context=context
+            )
+            round_prefix = f"Round {round_num}: "
+            # Later rounds quote this run's earlier arguments, so only the
+            # opening round depends on the topic alone and may be cached
+            debate_scope = make_scope(policy_topic, 'debate:1') if round_num == 1 else None
             
-            for i, agent_id in enumerate(domain_experts):
+            async def _debate_one(i: int, agent_id: str):
                 await self.emit_event('agent_started', {
                     'agent_id': agent_id,
-                    'agent_name': agent_id.replace('_', ' ').title(),
+                    'agent_name': self._agent_labels[agent_id],
                     'action': f'debating (Round {round_num})',
-                    'progress': f"Round {round_num}: {i+1}/{len(domain_experts)}"
+                    'progress': f"{round_prefix}{i+1}{denom}"
                 }, session_id)
                 
-                # Build context from previous arguments
-                context = self._build_debate_context(debate_history, round_num, agent_id)
-                
-                # Create task with previous arguments as context
-                task_description = f"""
-                **Round {round_num} Debate on: {policy_topic}**
-                
-                Previous Arguments from Other Experts:
-                {context}
-                
-                Your Task:
-                1. Consider the arguments presented by other experts above
-                2. Identify points of agreement and disagreement
-                3. Present YOUR perspective on {policy_topic}
-                4. Respond to arguments you disagree with (provide counter-arguments)
-                5. Build upon arguments you agree with (provide supporting evidence)
-                6. Propose synthesis or compromise positions where appropriate
-                
-                Be specific, evidence-based, and engage directly with others' points.
-                """
-                
-                from crewai import Task
                 task = Task(
                     description=task_description,
                     agent=agents[agent_id],
                     expected_output=f"Detailed argument with responses to other experts' points"
                 )
                 
-                crew = Crew(
-                    agents=[agents[agent_id]], 
-                    tasks=[task], 
-                    process=Process.sequential, 
-                    verbose=False
-                )
-                result = await asyncio.to_thread(crew.kickoff)
-                
+                result = await self._run_task(agents[agent_id], task, debate_scope)
                 argument = str(result)
-                round_arguments[agent_id] = argument
                 
-                # Add to debate history
+                await self.emit_event('agent_completed', {
+                    'agent_id': agent_id,
+                    'output': _truncate(result),
+                    'round': round_num
+                }, session_id)
+                
+                return agent_id, argument
+            
+            results = await _gather_or_cancel([
+                _debate_one(i, agent_id) for i, agent_id in enumerate(domain_experts)
+            ])
+            
+            # Record the round in speaking order, regardless of finish order
+            round_arguments = {}
+            for agent_id, argument in results:
+                round_arguments[agent_id] = argument
                 debate_history.append({
                     'round': round_num,
                     'agent_id': agent_id,
-                    'agent_name': agent_id.replace('_', ' ').title(),
+                    'agent_name': self._agent_labels[agent_id],
                     'argument': argument
                 })
-                
-                await self.emit_event('agent_completed', {
-                    'agent_id': agent_id,
-                    'output': argument[:500],
-                    'round': round_num
-                }, session_id)
             
-            # Check for consensus after each round
-            if round_num < max_rounds:
+            # Check for consensus after each rebuttal round; round 1 arguments
+            # are opening statements with nothing yet to agree or disagree with
+            if 1 < round_num < max_rounds:
                 consensus_level = await self._assess_consensus(session_id, round_arguments, agents)
                 
                 await self.emit_event('consensus_check', {
@@ -451,7 +600,7 @@ class IntegratedDeliberationSystem:
                     }, session_id)
                     break
         
-        self.results['debate'] = {
+        self.results.debate = {
             'history': debate_history,
             'rounds': round_num,
             'consensus_reached': consensus_reached
@@ -464,23 +613,30 @@ class IntegratedDeliberationSystem:
             'consensus_reached': consensus_reached
         }, session_id)
     
-    def _build_debate_context(self, debate_history: list, current_round: int, current_agent: str) -> str:
+    def _build_debate_context(self, debate_history: list, current_round: int, current_agent: Optional[str] = None) -> str:
         """Build context from previous debate rounds"""
         if not debate_history:
             return "No previous arguments yet. You are among the first to speak."
         
-        # Get arguments from previous round or earlier in current round
-        relevant_args = [
-            arg for arg in debate_history 
-            if arg['round'] < current_round or (arg['round'] == current_round and arg['agent_id'] != current_agent)
-        ]
+        # Get arguments from previous rounds, plus other agents' arguments
+        # earlier in the current round when a current_agent is given
+        # Walk back from the newest entry and stop at the last 5 matches
+        relevant_args = []
+        for arg in reversed(debate_history):
+            if arg['round'] < current_round or (
+                current_agent is not None and arg['round'] == current_round and arg['agent_id'] != current_agent
+            ):
+                relevant_args.append(arg)
+                if len(relevant_args) == 5:
+                    break
+        relevant_args.reverse()
         
         if not relevant_args:
             return "No previous arguments in this round yet."
         
         # Format last 5 arguments for context
         context_parts = []
-        for arg in relevant_args[-5:]:
+        for arg in relevant_args:
             context_parts.append(f"""
             **{arg['agent_name']} (Round {arg['round']}):**
             {arg['argument'][:300]}...
@@ -493,14 +649,10 @@ class IntegratedDeliberationSystem:
         # Simple heuristic: Check for agreement keywords and sentiment similarity
         # In production, you'd use NLP/LLM to analyze semantic similarity
         
-        agreement_keywords = ['agree', 'support', 'concur', 'consensus', 'aligned', 'correct']
-        disagreement_keywords = ['disagree', 'oppose', 'against', 'however', 'but', 'contrary']
-        
         total_score = 0
         for argument in round_arguments.values():
-            arg_lower = argument.lower()
-            agreement_count = sum(1 for kw in agreement_keywords if kw in arg_lower)
-            disagreement_count = sum(1 for kw in disagreement_keywords if kw in arg_lower)
+            agreement_count = len(_AGREE_RE.findall(argument))
+            disagreement_count = len(_DISAGREE_RE.findall(argument))
             
             # Score based on agreement vs disagreement ratio
             if agreement_count + disagreement_count > 0:
@@ -518,37 +670,44 @@ class IntegratedDeliberationSystem:
             'message': 'Experts casting votes...'
         }, session_id)
         
-        domain_experts = [
-            a for a in agents.keys()
-            if a not in ['problem_statement', 'turn_management', 'voting_announcement']
-        ]
+        domain_experts = self._domain_experts
+        
+        voting_results = dict.fromkeys(domain_experts)
+        started = itertools.count(1)
+        denom = f"/{len(domain_experts)}"
         
-        voting_results = {}
-        for i, agent_id in enumerate(domain_experts):
+        async def _run_one_vote(agent_id: str):
             await self.emit_event('agent_started', {
                 'agent_id': agent_id,
-                'agent_name': agent_id.replace('_', ' ').title(),
+                'agent_name': self._agent_labels[agent_id],
                 'action': 'voting',
-                'progress': f"{i+1}/{len(domain_experts)}"
+                'progress': f"{next(started)}{denom}"
             }, session_id)
             
             task = self.task_system.create_voting_task(agents[agent_id], policy_topic)
-            crew = Crew(agents=[agents[agent_id]], tasks=[task], process=Process.sequential, verbose=False)
-            result = await asyncio.to_thread(crew.kickoff)
+            # Never cached: the prompt names only the topic, so a hit would
+            # replay an earlier run's vote regardless of this run's debate
+            result = await self._run_task(agents[agent_id], task)
             
-            voting_results[agent_id] = str(result)
+            result_str = str(result)
+            voting_results[agent_id] = result_str
             
             await self.emit_event('vote_cast', {
                 'agent_id': agent_id,
-                'vote': str(result)[:200]
+                'vote': _truncate(result, 200)
             }, session_id)
             
             await self.emit_event('agent_completed', {
                 'agent_id': agent_id,
-                'output': str(result)[:500]
+                'output': _truncate(result)
             }, session_id)
         
-        self.results['voting'] = voting_results
+        # Votes are cast independently, so collect them concurrently
+        await _gather_or_cancel([
+            _run_one_vote(agent_id) for agent_id in domain_experts
+        ])
+        
+        self.results.voting = voting_results
         
         await self.emit_event('phase_completed', {
             'phase': 5,
@@ -572,25 +731,19 @@ class IntegratedDeliberationSystem:
         }, session_id)
         
         task = self.task_system.create_voting_coordination_task(agent, policy_topic, "Review all votes above")
-        crew = Crew(agents=[agent], tasks=[task], process=Process.sequential, verbose=False)
-        result = await asyncio.to_thread(crew.kickoff)
+        # Uncached for the same reason as the votes it announces
+        result = await self._run_task(agent, task)
         
-        self.results['final_announcement'] = str(result)
+        result_str = str(result)
+        self.results.final_announcement = result_str
         
-        # Try to extract decision
-        result_str = str(result).upper()
-        if 'APPROVED' in result_str or 'APPROVE' in result_str:
-            final_decision = 'APPROVED'
-        elif 'REJECTED' in result_str or 'REJECT' in result_str:
-            final_decision = 'REJECTED'
-        else:
-            final_decision = 'CONDITIONAL'
+        final_decision = OutputValidator.extract_decision(result_str)
         
-        self.results['final_decision'] = final_decision
+        self.results.final_decision = final_decision
         
         await self.emit_event('results_announced', {
             'decision': final_decision,
-            'announcement': str(result)[:500]
+            'announcement': _truncate(result)
         }, session_id)
         
         await self.emit_event('phase_completed', {
@@ -611,15 +764,15 @@ class IntegratedDeliberationSystem:
         report = {
             'policy_topic': policy_topic,
             'timestamp': datetime.now().isoformat(),
-            'problem_statement': self.results.get('problem_statement', ''),
-            'research_count': len(self.results.get('research', {})),
-            'debate_count': len(self.results.get('debate', {})),
-            'votes_count': len(self.results.get('voting', {})),
-            'final_decision': self.results.get('final_decision', 'Unknown'),
-            'final_announcement': self.results.get('final_announcement', '')
+            'problem_statement': self.results.problem_statement,
+            'research_count': len(self.results.research),
+            'debate_count': len(self.results.debate),
+            'votes_count': len(self.results.voting),
+            'final_decision': self.results.final_decision,
+            'final_announcement': self.results.final_announcement
         }
         
-        self.results['final_report'] = report
+        self.results.final_report = report
         
         await self.emit_event('report_generated', {
             'report': report
@@ -3,11 +3,56 @@ Output Validation Module
 Validates LLM outputs to ensure they are policy analysis, not code
 """
 
+import functools
 import re
 import logging
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+
+def _compile(pattern: str, flags: int = 0):
+    """
+    Compile with re2 when installed, falling back to stdlib re
+    
+    re2 matches in linear time, so a malformed LLM output can't trigger
+    catastrophic backtracking. Flags are passed inline since re2 has its
+    own options object; patterns re2 rejects use stdlib re.
+    """
+    if RE2_AVAILABLE:
+        inline = ''.join(c for flag, c in _INLINE_FLAGS if flags & flag)
+        try:
+            return re2.compile(f"(?{inline}){pattern}" if inline else pattern)
+        except re2.error:
+            logger.debug("re2 rejected %r, using stdlib re", pattern)
+    return re.compile(pattern, flags)
+
+
+def _build_keyword_automaton(keywords):
+    """Aho-Corasick automaton over keywords, or None without pyahocorasick"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
 
 class OutputValidator:
     """Validates and sanitizes LLM outputs"""
@@ -33,6 +78,34 @@ class OutputValidator:
         r'\$\$\s*\\begin\{',  # LaTeX math blocks
     ]
     
+    # All code patterns as one alternation, compiled once at import, so clean
+    # prose is rejected in a single scan; group cN maps back to CODE_PATTERNS[N]
+    _CODE_PATTERN_RE = _compile(
+        "|".join(f"(?P<c{i}>{p})" for i, p in enumerate(CODE_PATTERNS)),
+        re.IGNORECASE | re.MULTILINE
+    )
+    
+    # Removal passes used by extract_policy_content, applied in this order:
+    # each pass sees the text left by the previous one (e.g. frontmatter only
+    # exposed once tags are gone), so they can't be merged into one scan
+    _STRIP_PASSES = (
+        _compile(r'```[\w]*\n.*?```', re.DOTALL),  # code blocks
+        _compile(r'<[^>]+>'),  # HTML/XML tags
+        _compile(r'\$\$.*?\$\$', re.DOTALL),  # LaTeX math blocks
+        _compile(r'^---.*?---', re.DOTALL | re.MULTILINE),  # frontmatter
+    )
+    _RE_WS = _compile(r'\n{3,}')
+    
+    # Explicit "DECISION:" / "FINAL DECISION:" line of a voting announcement
+    _DECISION_LINE_RE = _compile(
+        r'^[\s>*#-]*(?:FINAL\s+)?DECISION[*\s]*:(.*)$', re.IGNORECASE | re.MULTILINE
+    )
+    # Verdict words; a conditional approval is its own outcome
+    _VERDICT_RE = _compile(
+        r'\b(CONDITIONAL(?:LY)?\s+APPROV(?:E|ED|ES|AL)|APPROV(?:E|ED|ES)|REJECT(?:S|ED)?)\b',
+        re.IGNORECASE
+    )
+    
     # Keywords that suggest code instead of policy analysis
     CODE_KEYWORDS = [
         'jupyter', 'notebook', 'algorithm', 'implementation',
@@ -43,6 +116,35 @@ class OutputValidator:
         'docker', 'kubernetes', 'api endpoint', 'sql query'
     ]
     
+    # Terms expected in genuine policy analysis
+    POLICY_KEYWORDS = [
+        'policy', 'carbon tax', 'economic', 'fiscal', 'impact',
+        'government', 'revenue', 'emission', 'climate', 'environment',
+        'stakeholder', 'implementation', 'analysis', 'evidence'
+    ]
+    
+    _CODE_KEYWORD_SET = frozenset(CODE_KEYWORDS)
+    _POLICY_KEYWORD_SET = frozenset(POLICY_KEYWORDS)
+    
+    # Finds every code and policy keyword in one pass over the output
+    _KEYWORD_AUTOMATON = _build_keyword_automaton(_CODE_KEYWORD_SET | _POLICY_KEYWORD_SET)
+    
+    # Stdlib fallback for the automaton: a lookahead alternation reports a
+    # keyword at every position, so overlapping keywords are all found.
+    # Keywords match as substrings ('economic' in 'socioeconomic'), so this
+    # can't be a whole-word token lookup
+    _KEYWORD_RE = re.compile('(?=({}))'.format('|'.join(
+        re.escape(kw) for kw in sorted(_CODE_KEYWORD_SET | _POLICY_KEYWORD_SET, key=len, reverse=True)
+    )))
+    
+    @staticmethod
+    def _find_keywords(output_lower: str) -> frozenset:
+        """Every code and policy keyword occurring in the lower-cased output"""
+        automaton = OutputValidator._KEYWORD_AUTOMATON
+        if automaton is not None:
+            return frozenset(kw for _, kw in automaton.iter(output_lower))
+        return frozenset(OutputValidator._KEYWORD_RE.findall(output_lower))
+    
     @staticmethod
     def is_valid_policy_output(output: str) -> tuple[bool, str]:
         """
@@ -55,25 +157,23 @@ class OutputValidator:
             return False, "Output too short"
         
         # Check for code block patterns
-        for pattern in OutputValidator.CODE_PATTERNS:
-            if re.search(pattern, output, re.IGNORECASE | re.MULTILINE):
-                return False, f"Contains code pattern: {pattern}"
+        match = OutputValidator._CODE_PATTERN_RE.search(output)
+        if match:
+            pattern = OutputValidator.CODE_PATTERNS[int(match.lastgroup[1:])]
+            return False, f"Contains code pattern: {pattern}"
+        
+        # One scan collects the keywords present; both counts are then
+        # intersections with the keyword sets
+        found = OutputValidator._find_keywords(output.lower())
         
         # Count code-like keywords
-        output_lower = output.lower()
-        code_keyword_count = sum(1 for kw in OutputValidator.CODE_KEYWORDS if kw in output_lower)
+        code_keyword_count = len(found & OutputValidator._CODE_KEYWORD_SET)
         
         if code_keyword_count >= 3:
             return False, f"Contains too many code keywords ({code_keyword_count})"
         
         # Check if it mentions policy-related terms
-        policy_keywords = [
-            'policy', 'carbon tax', 'economic', 'fiscal', 'impact',
-            'government', 'revenue', 'emission', 'climate', 'environment',
-            'stakeholder', 'implementation', 'analysis', 'evidence'
-        ]
-        
-        policy_keyword_count = sum(1 for kw in policy_keywords if kw in output_lower)
+        policy_keyword_count = len(found & OutputValidator._POLICY_KEYWORD_SET)
         
         if policy_keyword_count < 2:
             return False, "Lacks policy-related content"
@@ -86,24 +186,61 @@ class OutputValidator:
         Try to extract policy analysis from mixed content
         Removes code blocks and focuses on prose
         """
-        # Remove code blocks
-        output = re.sub(r'```[\w]*\n.*?```', '', output, flags=re.DOTALL)
-        
-        # Remove HTML/XML tags
-        output = re.sub(r'<[^>]+>', '', output)
-        
-        # Remove LaTeX math blocks
-        output = re.sub(r'\$\$.*?\$\$', '', output, flags=re.DOTALL)
-        
-        # Remove frontmatter
-        output = re.sub(r'^---.*?---', '', output, flags=re.DOTALL | re.MULTILINE)
+        # Remove code blocks, HTML/XML tags, LaTeX math and frontmatter
+        for pattern in OutputValidator._STRIP_PASSES:
+            output = pattern.sub('', output)
         
         # Clean up extra whitespace
-        output = re.sub(r'\n{3,}', '\n\n', output)
+        output = OutputValidator._RE_WS.sub('\n\n', output)
         output = output.strip()
         
         return output
     
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def validate_and_extract(output: str) -> tuple[bool, str, str]:
+        """
+        Validate an output and, if valid, clean it in one cached call
+        
+        Identical outputs (e.g. repeated refusals) skip both passes. This
+        is the only cached layer, so each output string is held once.
+        
+        Returns:
+            (is_valid, reason, cleaned_output); cleaned_output is empty
+            when the output is invalid
+        """
+        is_valid, reason = OutputValidator.is_valid_policy_output(output)
+        if not is_valid:
+            return False, reason, ""
+        return True, reason, OutputValidator.extract_policy_content(output)
+    
+    @staticmethod
+    def extract_decision(announcement: str) -> str:
+        """
+        Final decision from a voting announcement
+        
+        The verdict on an explicit DECISION line wins; otherwise the last
+        verdict word counts, since announcements walk through the votes
+        and arguments before concluding.
+        
+        Returns:
+            'APPROVED', 'REJECTED', or 'CONDITIONAL' for a conditional
+            approval or when no verdict appears
+        """
+        verdicts = []
+        line = OutputValidator._DECISION_LINE_RE.search(announcement)
+        if line:
+            verdicts = OutputValidator._VERDICT_RE.findall(line.group(1))[:1]
+        if not verdicts:
+            verdicts = OutputValidator._VERDICT_RE.findall(announcement)[-1:]
+        if not verdicts:
+            return 'CONDITIONAL'
+        
+        verdict = verdicts[0].upper()
+        if verdict.startswith('CONDITIONAL'):
+            return 'CONDITIONAL'
+        return 'APPROVED' if verdict.startswith('APPROV') else 'REJECTED'
+    
     @staticmethod
     def create_fallback_response(agent_role: str, policy_topic: str) -> str:
         """
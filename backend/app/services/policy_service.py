@@ -2,25 +2,39 @@
 Policy Service - WebSocket-enabled policy deliberation with Real AI Agents
 """
 import asyncio
+import itertools
+import os
 import uuid
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Set
 from dataclasses import dataclass, asdict
-import json
 import logging
 
 from .integrated_deliberation import IntegratedDeliberationSystem
 
 logger = logging.getLogger(__name__)
 
+# Last formatted timestamp, keyed by the event loop's millisecond
+_ts_cache = {"tick": None, "iso": None}
 
-@dataclass
+
+def _now_iso() -> str:
+    """UTC ISO timestamp, formatted at most once per loop millisecond"""
+    tick = int(asyncio.get_running_loop().time() * 1000)
+    if _ts_cache["tick"] != tick:
+        _ts_cache["tick"] = tick
+        _ts_cache["iso"] = datetime.utcnow().isoformat()
+    return _ts_cache["iso"]
+
+
+@dataclass(slots=True)
 class PolicySession:
-    """Represents a policy deliberation session"""
+    """Represents a policy deliberation session (slotted; sessions are long-lived)"""
     session_id: str
     policy_topic: str
     background_context: str
-    status: str  # 'initializing', 'running', 'completed', 'error'
+    status: str  # 'initializing', 'queued', 'running', 'completed', 'error'
     current_phase: int
     phase_name: str
     created_at: str
@@ -34,25 +48,97 @@ class PolicyService:
     Service layer for policy deliberation with Real AI Agents
     """
     
-    def __init__(self, event_emitter: Optional[Callable] = None):
+    # Events are coalesced over this window (seconds) into 'events_batch' frames
+    EVENT_BATCH_WINDOW = 0.05
+    
+    # Latency-critical events bypass the batch window
+    IMMEDIATE_EVENTS = frozenset({'deliberation_error'})
+    
+    def __init__(self, event_emitter: Optional[Callable] = None, max_sessions: Optional[int] = None,
+                 max_concurrent_deliberations: Optional[int] = None):
         """
         Initialize policy service
         
         Args:
             event_emitter: Async function to emit WebSocket events
+            max_sessions: Sessions kept in memory before the least recently
+                          used finished one is evicted; defaults to the
+                          KAZIWIZ_MAX_SESSIONS env var, else 1000
+            max_concurrent_deliberations: Deliberations allowed to run at once;
+                          later ones wait as 'queued'. Defaults to the
+                          KAZIWIZ_MAX_DELIBERATIONS env var, else 1, since
+                          the shared deliberation system keeps per-run state
         """
         self.event_emitter = event_emitter
+        self.max_sessions = max_sessions or int(os.getenv("KAZIWIZ_MAX_SESSIONS", "1000"))
+        # Creation order, which list_sessions pages over; it never reorders
         self.active_sessions: Dict[str, PolicySession] = {}
-        self.deliberation_system = IntegratedDeliberationSystem(event_emitter=event_emitter)
+        # Recency order for eviction only, least recently used first
+        self._session_lru: OrderedDict[str, None] = OrderedDict()
+        self._deliberation_tasks: Set[asyncio.Task] = set()
+        self.max_concurrent_deliberations = max_concurrent_deliberations or int(
+            os.getenv("KAZIWIZ_MAX_DELIBERATIONS", "1")
+        )
+        self._deliberation_sem = asyncio.Semaphore(self.max_concurrent_deliberations)
+        
+        # Batched emits; the drainer starts on first emit since no event loop
+        # is running yet when the service is constructed. The lock keeps the
+        # drainer and immediate sends from interleaving frames out of order
+        self._pending_events: List[tuple] = []
+        self._has_pending = asyncio.Event()
+        self._send_lock = asyncio.Lock()
+        self._drain_task: Optional[asyncio.Task] = None
+        
+        # Deliberation events go through the same batch queue as ours
+        self.deliberation_system = IntegratedDeliberationSystem(event_emitter=self.emit_event)
         logger.info("✅ Policy Service initialized with Real Agent System")
         
     async def emit_event(self, event: str, data: dict, session_id: str = None):
-        """Emit WebSocket event if emitter is available"""
-        if self.event_emitter:
-            try:
-                await self.event_emitter(event, data, session_id)
-            except Exception as e:
-                print(f"Error emitting event {event}: {e}")
+        """Queue a WebSocket event for the next batch if emitter is available"""
+        if not self.event_emitter:
+            return
+        
+        if event in self.IMMEDIATE_EVENTS:
+            # Send everything queued before it first, so the stream stays ordered
+            async with self._send_lock:
+                await self._send_pending()
+                await self._send_event(event, data, session_id)
+            return
+        
+        self._pending_events.append((event, data, session_id))
+        self._has_pending.set()
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain_events())
+    
+    async def _drain_events(self):
+        """Once per batch window, send whatever has queued up"""
+        while True:
+            await self._has_pending.wait()
+            await asyncio.sleep(self.EVENT_BATCH_WINDOW)
+            async with self._send_lock:
+                await self._send_pending()
+    
+    async def _send_pending(self):
+        """Send the queued events, one frame per session; caller holds _send_lock"""
+        items, self._pending_events = self._pending_events, []
+        self._has_pending.clear()
+        
+        by_session: Dict[Optional[str], list] = {}
+        for event, data, session_id in items:
+            by_session.setdefault(session_id, []).append({'event': event, 'data': data})
+        
+        for session_id, events in by_session.items():
+            if len(events) == 1:
+                await self._send_event(events[0]['event'], events[0]['data'], session_id)
+            else:
+                await self._send_event('events_batch', {'events': events}, session_id)
+    
+    async def _send_event(self, event: str, data: dict, session_id: Optional[str]):
+        """Emit one WebSocket frame, isolating emitter failures"""
+        try:
+            await self.event_emitter(event, data, session_id)
+        except Exception as e:
+            print(f"Error emitting event {event}: {e}")
     
     async def create_session(self, policy_data: dict) -> PolicySession:
         """
@@ -65,7 +151,7 @@ class PolicyService:
             PolicySession object
         """
         session_id = str(uuid.uuid4())
-        now = datetime.utcnow().isoformat()
+        now = _now_iso()
         
         session = PolicySession(
             session_id=session_id,
@@ -80,7 +166,9 @@ class PolicyService:
             results={}
         )
         
+        self._evict_sessions()
         self.active_sessions[session_id] = session
+        self._session_lru[session_id] = None
         
         # Emit session created event
         await self.emit_event('session_created', {
@@ -93,7 +181,10 @@ class PolicyService:
     
     async def start_deliberation(self, session_id: str):
         """
-        Start the deliberation process for a session
+        Queue the deliberation process for a session
+        
+        Returns as soon as the deliberation is scheduled; the work itself
+        runs as a background task.
         
         Args:
             session_id: Session identifier
@@ -102,8 +193,11 @@ class PolicyService:
             raise ValueError(f"Session {session_id} not found")
         
         session = self.active_sessions[session_id]
-        session.status = 'running'
-        session.updated_at = datetime.utcnow().isoformat()
+        if session.status in ('queued', 'running'):
+            raise ValueError(f"Session {session_id} is already {session.status}")
+        
+        session.status = 'queued'
+        session.updated_at = _now_iso()
         
         # Emit deliberation started
         await self.emit_event('deliberation_started', {
@@ -111,15 +205,25 @@ class PolicyService:
             'policy_topic': session.policy_topic
         }, session_id)
         
-        # Start async deliberation (placeholder - will integrate with agents)
-        # This will be replaced with actual agent system integration
-        asyncio.create_task(self._run_deliberation(session_id))
+        # Keep a reference so the task is not garbage collected mid-run
+        task = asyncio.create_task(self._run_deliberation(session_id))
+        self._deliberation_tasks.add(task)
+        task.add_done_callback(self._deliberation_tasks.discard)
     
     async def _run_deliberation(self, session_id: str):
         """
         Run the actual deliberation process with Real AI Agents
+        
+        Waits (status 'queued') until a deliberation slot is free.
         """
+        async with self._deliberation_sem:
+            await self._run_deliberation_now(session_id)
+    
+    async def _run_deliberation_now(self, session_id: str):
+        """Run a deliberation that holds a concurrency slot"""
         session = self.active_sessions[session_id]
+        session.status = 'running'
+        session.updated_at = _now_iso()
         
         try:
             # Execute real agent deliberation
@@ -145,14 +249,14 @@ class PolicyService:
                 'error': str(e)
             }, session_id)
         
-        session.updated_at = datetime.utcnow().isoformat()
+        session.updated_at = _now_iso()
     
     async def _run_phase(self, session_id: str, phase_num: int, phase_name: str, duration: int):
         """Simulate running a phase"""
         session = self.active_sessions[session_id]
         session.current_phase = phase_num
         session.phase_name = phase_name
-        session.updated_at = datetime.utcnow().isoformat()
+        session.updated_at = _now_iso()
         
         await self.emit_event('phase_changed', {
             'session_id': session_id,
@@ -163,20 +267,45 @@ class PolicyService:
         # Simulate phase work
         await asyncio.sleep(duration)
     
+    def _evict_sessions(self):
+        """Make room for one more session by dropping the least recently used
+        finished ones; queued and running sessions are never evicted"""
+        excess = len(self.active_sessions) - self.max_sessions + 1
+        if excess <= 0:
+            return
+        
+        # Oldest first, stopping as soon as enough are found
+        evictable = []
+        for sid in self._session_lru:
+            if self.active_sessions[sid].status not in ('queued', 'running'):
+                evictable.append(sid)
+                if len(evictable) == excess:
+                    break
+        for sid in evictable:
+            del self.active_sessions[sid]
+            del self._session_lru[sid]
+        
+        if len(evictable) < excess:
+            logger.warning(f"Session store over capacity ({len(self.active_sessions)}/{self.max_sessions}): all remaining sessions are active")
+    
     def get_session(self, session_id: str) -> Optional[PolicySession]:
-        """Get session by ID"""
-        return self.active_sessions.get(session_id)
+        """Get session by ID, marking it as recently used"""
+        session = self.active_sessions.get(session_id)
+        if session is not None:
+            self._session_lru.move_to_end(session_id)
+        return session
     
-    def list_sessions(self) -> List[PolicySession]:
-        """List all sessions"""
-        return list(self.active_sessions.values())
+    def list_sessions(self, limit: Optional[int] = None, offset: int = 0) -> List[PolicySession]:
+        """List sessions in creation order, optionally paged by limit/offset"""
+        stop = offset + limit if limit is not None else None
+        return list(itertools.islice(self.active_sessions.values(), offset, stop))
     
     async def update_agent_status(self, session_id: str, agent_name: str, status: dict):
         """Update individual agent status"""
         if session_id in self.active_sessions:
             session = self.active_sessions[session_id]
             session.agents_status[agent_name] = status
-            session.updated_at = datetime.utcnow().isoformat()
+            session.updated_at = _now_iso()
             
             await self.emit_event('agent_status_update', {
                 'session_id': session_id,
@@ -0,0 +1,250 @@
+"""
+Semantic Cache Module
+Reuses agent responses for near-duplicate prompts
+"""
+
+import contextlib
+import hashlib
+import logging
+import re
+import threading
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SentenceTransformer = None
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Exact partition for cache lookups, set by the caller around each task run.
+# Prompts are long fixed templates and the embedder truncates, so different
+# policy topics can embed almost identically; similarity is therefore only
+# trusted within one scope. No scope means no caching
+cache_scope: ContextVar[Optional[str]] = ContextVar("semantic_cache_scope", default=None)
+
+
+def normalize_query(text: str) -> str:
+    """Lower-case and collapse whitespace so trivial variations share a key"""
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+def make_scope(policy_topic: str, task_kind: str) -> str:
+    """Scope key for one task kind (e.g. 'research', 'debate:2') on one topic"""
+    digest = hashlib.sha1(normalize_query(policy_topic).encode()).hexdigest()[:16]
+    return f"{digest}:{task_kind}"
+
+
+@contextlib.contextmanager
+def scoped(scope: Optional[str]):
+    """Run the enclosed task executions under the given cache scope"""
+    token = cache_scope.set(scope)
+    try:
+        yield
+    finally:
+        cache_scope.reset(token)
+
+
+def _best_match_numpy(matrix, q_vec, role_ids, role_id, threshold):
+    """Index and score of the best same-role row above threshold, else -1"""
+    scores = matrix @ q_vec
+    scores[role_ids != role_id] = -1.0
+    best = int(np.argmax(scores))
+    if scores[best] < threshold:
+        return -1, float(scores[best])
+    return best, float(scores[best])
+
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _best_match(matrix, q_vec, role_ids, role_id, threshold):
+        # Fused scan: dot, role filter, threshold and argmax without temporaries.
+        # Serial on purpose - a prange argmax races on best_i/best_s
+        best_i = -1
+        best_s = threshold
+        for i in range(matrix.shape[0]):
+            if role_ids[i] != role_id:
+                continue
+            s = 0.0
+            for j in range(matrix.shape[1]):
+                s += matrix[i, j] * q_vec[j]
+            if s >= best_s:
+                best_s = s
+                best_i = i
+        return best_i, best_s
+else:
+    _best_match = _best_match_numpy
+
+
+def warm_kernels() -> None:
+    """Trigger (or load the cached) numba compilation before first use"""
+    matrix = np.zeros((1, 4), dtype=np.float32)
+    _best_match(matrix, matrix[0], np.zeros(1, dtype=np.int32), 0, 1.0)
+
+
+class SemanticCache:
+    """
+    Embedding-keyed response cache with LRU eviction
+
+    Embeddings live in one contiguous float32 matrix so a lookup is a
+    single matrix-vector product. Rows are L2-normalized, so the dot
+    product is the cosine similarity. Hits must also match the bucket
+    exactly (role plus cache scope), so similarity only decides between
+    entries of the same kind. Without sentence-transformers installed the
+    cache is a no-op.
+    """
+
+    def __init__(self, capacity: int = 1024, threshold: float = 0.92,
+                 model_name: str = DEFAULT_EMBEDDING_MODEL):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.model_name = model_name
+        self.enabled = SENTENCE_TRANSFORMERS_AVAILABLE
+
+        self._model = None
+        self._lock = threading.Lock()
+        self._matrix: Optional[np.ndarray] = None   # (capacity, d) float32
+        self._role_ids = np.full(capacity, -1, dtype=np.int32)
+        self._last_used = np.zeros(capacity, dtype=np.int64)
+        self._responses: List[Optional[str]] = [None] * capacity
+        # Bucket label <-> id; ids are never reused so evicting a bucket's
+        # last row can't alias another bucket
+        self._roles: Dict[str, int] = {}
+        self._role_names: Dict[int, str] = {}
+        self._next_role_id = 0
+        self._size = 0
+        self._clock = 0
+
+        if not self.enabled:
+            logger.info("sentence-transformers not installed - semantic cache disabled")
+
+    @property
+    def model(self):
+        """Embedding model, loaded on first use"""
+        if self._model is None:
+            self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts as L2-normalized float32 rows"""
+        return self.model.encode(
+            texts, convert_to_numpy=True, normalize_embeddings=True
+        ).astype(np.float32, copy=False)
+
+    def _embed_query(self, query: str, role: str) -> np.ndarray:
+        return self.embed([f"{role}: {normalize_query(query)}"])[0]
+
+    def get(self, query: str, role: str) -> Optional[str]:
+        """Return a cached response for a similar query by the same role"""
+        if not self.enabled or self._size == 0:
+            return None
+
+        q_vec = self._embed_query(query, role)
+        with self._lock:
+            role_id = self._roles.get(role)
+            if role_id is None:
+                return None
+
+            best, _ = _best_match(
+                self._matrix[:self._size], q_vec,
+                self._role_ids[:self._size], role_id, self.threshold
+            )
+            if best < 0:
+                return None
+
+            self._clock += 1
+            self._last_used[best] = self._clock
+            return self._responses[best]
+
+    def put(self, query: str, role: str, response: str) -> None:
+        """Store a response, evicting the least recently used entry when full"""
+        if not self.enabled:
+            return
+
+        q_vec = self._embed_query(query, role)
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = np.zeros((self.capacity, q_vec.shape[0]), dtype=np.float32)
+
+            if self._size < self.capacity:
+                slot = self._size
+                self._size += 1
+            else:
+                slot = int(np.argmin(self._last_used))
+                self._release_bucket(slot)
+
+            role_id = self._roles.get(role)
+            if role_id is None:
+                role_id = self._roles[role] = self._next_role_id
+                self._role_names[role_id] = role
+                self._next_role_id += 1
+
+            self._clock += 1
+            self._matrix[slot] = q_vec
+            self._role_ids[slot] = role_id
+            self._last_used[slot] = self._clock
+            self._responses[slot] = response
+
+    def _release_bucket(self, slot: int) -> None:
+        """Forget the evicted slot's bucket label if it held its last row"""
+        old_id = int(self._role_ids[slot])
+        if np.count_nonzero(self._role_ids[:self._size] == old_id) == 1:
+            self._roles.pop(self._role_names.pop(old_id), None)
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        with self._lock:
+            self._size = 0
+            self._role_ids.fill(-1)
+            self._last_used.fill(0)
+            self._responses = [None] * self.capacity
+            self._roles.clear()
+            self._role_names.clear()
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def cached_execute_task(agent, cache: SemanticCache):
+    """
+    Wrap an Agent's execute_task so similar prompts are answered from cache
+
+    Entries are bucketed by the agent's role and the current cache_scope;
+    outside a scope the task runs uncached. Only completed responses are
+    written back, so partial or failed generations are never served.
+    """
+    execute_task = agent.execute_task
+
+    def wrapper(task, context=None, tools=None):
+        scope = cache_scope.get()
+        if scope is None:
+            return execute_task(task, context, tools)
+
+        bucket = f"{agent.role}\x00{scope}"
+        query = f"{task.description}\n{context}" if context else task.description
+        cached = cache.get(query, bucket)
+        if cached is not None:
+            return cached
+
+        result = execute_task(task, context, tools)
+        cache.put(query, bucket, str(result))
+        return result
+
+    # Agent is a pydantic model; bypass field validation for the override
+    object.__setattr__(agent, "execute_task", wrapper)
+    return agent
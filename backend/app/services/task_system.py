@@ -5,17 +5,10 @@ Defines tasks for all deliberation phases
 
 from crewai import Task
 
+# Prompt bodies are rendered once at import; each task only splices in its
+# dynamic fields via format_map
 
-class AgentTaskSystem:
-    """Centralized task creation system for all agents"""
-    
-    def __init__(self):
-        self.search_tools = []  # Can add tools later if needed
-    
-    def create_problem_statement_task(self, agent, policy_topic, context=""):
-        """Phase 2: Problem Statement Clarification"""
-        return Task(
-            description=f"""Clearly explain and articulate the policy problem: {policy_topic}
+_PROBLEM_STATEMENT_TEMPLATE = """Clearly explain and articulate the policy problem: {policy_topic}
             
             {context}
             
@@ -32,16 +25,9 @@ class AgentTaskSystem:
             DO NOT output code, programming syntax, or unrelated content.
             
             Ensure all participating experts understand the problem before analysis begins.
-            """,
-            agent=agent,
-            expected_output="Clear problem statement that all experts can understand and analyze. Must be in natural language, NOT code.",
-        )
-    
-    def create_turn_management_task(self, agent, expert_list, policy_topic):
-        """Phase 3: Turn Management Setup"""
-        experts = ", ".join(expert_list)
-        return Task(
-            description=f"""Establish discussion management for policy: {policy_topic}
+            """
+
+_TURN_MANAGEMENT_TEMPLATE = """Establish discussion management for policy: {policy_topic}
             
             PARTICIPATING EXPERTS:
             {experts}
@@ -54,15 +40,9 @@ class AgentTaskSystem:
             5. Create a structured timeline for deliberation
             
             Maintain neutrality and facilitate productive discussion.
-            """,
-            agent=agent,
-            expected_output="Discussion management plan with clear rules and deliberation structure.",
-        )
-    
-    def create_research_task(self, agent, policy_topic, focus_area):
-        """Phase 4: Research Tasks with Web Search"""
-        return Task(
-            description=f"""Research and analyze: {policy_topic}
+            """
+
+_RESEARCH_TEMPLATE = """Research and analyze: {policy_topic}
             
             YOUR FOCUS AREA: {focus_area}
             
@@ -100,15 +80,9 @@ class AgentTaskSystem:
             OUTPUT FORMAT: Write your analysis as a policy brief with clear paragraphs and bullet points.
             DO NOT output code, programming syntax, or unrelated content.
             Be thorough, objective, and evidence-based using real web-sourced information.
-            """,
-            agent=agent,
-            expected_output=f"Comprehensive research analysis from {focus_area} perspective with web-sourced evidence and clear position. Must be in natural language policy analysis format, NOT code.",
-        )
-    
-    def create_debate_task(self, agent, policy_topic, context=""):
-        """Phase 5: Debate Tasks"""
-        return Task(
-            description=f"""Participate in structured debate: {policy_topic}
+            """
+
+_DEBATE_TEMPLATE = """Participate in structured debate: {policy_topic}
             
             ⚠️ IMPORTANT: Provide debate arguments in natural language - NOT code!
             
@@ -135,15 +109,9 @@ class AgentTaskSystem:
             DO NOT output code or programming examples.
             
             Be objective, collaborative, and focused on the best solution.
-            """,
-            agent=agent,
-            expected_output="Structured debate contribution with opening statement, arguments, and synthesis. Must be in natural language, NOT code.",
-        )
-    
-    def create_voting_task(self, agent, policy_topic, arguments_summary=""):
-        """Phase 6: Voting Tasks"""
-        return Task(
-            description=f"""Cast your vote on policy: {policy_topic}
+            """
+
+_VOTING_TEMPLATE = """Cast your vote on policy: {policy_topic}
             
             {arguments_summary}
             
@@ -160,15 +128,9 @@ class AgentTaskSystem:
             - Critical Conditions (if applicable): [List any necessary conditions]
             
             Vote based on evidence and your expert judgment.
-            """,
-            agent=agent,
-            expected_output="Clear vote with decision, confidence level, reasoning, and any conditions.",
-        )
-    
-    def create_voting_coordination_task(self, agent, policy_topic, votes_summary=""):
-        """Phase 7: Vote Tallying and Announcement"""
-        return Task(
-            description=f"""Tally votes and announce final decision: {policy_topic}
+            """
+
+_VOTING_COORDINATION_TEMPLATE = """Tally votes and announce final decision: {policy_topic}
             
             {votes_summary}
             
@@ -191,7 +153,62 @@ class AgentTaskSystem:
             - IMPLEMENTATION RECOMMENDATIONS: [List]
             
             Ensure transparency and clarity in the final announcement.
-            """,
+            """
+
+_RESEARCH_EXPECTED_OUTPUT = "Comprehensive research analysis from {focus_area} perspective with web-sourced evidence and clear position. Must be in natural language policy analysis format, NOT code."
+
+
+class AgentTaskSystem:
+    """Centralized task creation system for all agents"""
+    
+    def __init__(self):
+        self.search_tools = []  # Can add tools later if needed
+    
+    def create_problem_statement_task(self, agent, policy_topic, context=""):
+        """Phase 2: Problem Statement Clarification"""
+        return Task(
+            description=_PROBLEM_STATEMENT_TEMPLATE.format_map({"policy_topic": policy_topic, "context": context}),
+            agent=agent,
+            expected_output="Clear problem statement that all experts can understand and analyze. Must be in natural language, NOT code.",
+        )
+    
+    def create_turn_management_task(self, agent, expert_list, policy_topic):
+        """Phase 3: Turn Management Setup"""
+        experts = ", ".join(expert_list)
+        return Task(
+            description=_TURN_MANAGEMENT_TEMPLATE.format_map({"policy_topic": policy_topic, "experts": experts}),
+            agent=agent,
+            expected_output="Discussion management plan with clear rules and deliberation structure.",
+        )
+    
+    def create_research_task(self, agent, policy_topic, focus_area):
+        """Phase 4: Research Tasks with Web Search"""
+        return Task(
+            description=_RESEARCH_TEMPLATE.format_map({"policy_topic": policy_topic, "focus_area": focus_area}),
+            agent=agent,
+            expected_output=_RESEARCH_EXPECTED_OUTPUT.format_map({"focus_area": focus_area}),
+        )
+    
+    def create_debate_task(self, agent, policy_topic, context=""):
+        """Phase 5: Debate Tasks"""
+        return Task(
+            description=_DEBATE_TEMPLATE.format_map({"policy_topic": policy_topic, "context": context}),
+            agent=agent,
+            expected_output="Structured debate contribution with opening statement, arguments, and synthesis. Must be in natural language, NOT code.",
+        )
+    
+    def create_voting_task(self, agent, policy_topic, arguments_summary=""):
+        """Phase 6: Voting Tasks"""
+        return Task(
+            description=_VOTING_TEMPLATE.format_map({"policy_topic": policy_topic, "arguments_summary": arguments_summary}),
+            agent=agent,
+            expected_output="Clear vote with decision, confidence level, reasoning, and any conditions.",
+        )
+    
+    def create_voting_coordination_task(self, agent, policy_topic, votes_summary=""):
+        """Phase 7: Vote Tallying and Announcement"""
+        return Task(
+            description=_VOTING_COORDINATION_TEMPLATE.format_map({"policy_topic": policy_topic, "votes_summary": votes_summary}),
             agent=agent,
             expected_output="Comprehensive final decision announcement with vote tally and reasoning.",
         )
@@ -3,51 +3,73 @@ Research Tools Module
 Provides web search and browsing capabilities for agents
 """
 
+import functools
 import os
+import threading
 from crewai_tools import SerperDevTool, ScrapeWebsiteTool
 
 
+# Tool construction reads env vars and sets up HTTP sessions, so each tool is
+# built once per process and shared by every ResearchTools instance
+
+@functools.cache
+def _get_search_tool():
+    """Web Search Tool (Google Search via Serper), or None without an API key"""
+    if not os.environ.get("SERPER_API_KEY"):
+        print("⚠️  SERPER_API_KEY not found - web search disabled")
+        return None
+    try:
+        tool = SerperDevTool()
+        print(f"✅ SerperDevTool initialized with API key")
+        return tool
+    except Exception as e:
+        print(f"⚠️  SerperDevTool initialization failed: {e}")
+        return None
+
+
+@functools.cache
+def _get_scrape_tool():
+    """Website scraping tool, or None if it fails to initialize"""
+    try:
+        tool = ScrapeWebsiteTool()
+        print(f"✅ ScrapeWebsiteTool initialized")
+        return tool
+    except Exception as e:
+        print(f"⚠️  ScrapeWebsiteTool initialization failed: {e}")
+        return None
+
+
 class ResearchTools:
     """Centralized tool management for agent research"""
     
+    _instance = None
+    _instance_lock = threading.Lock()
+    
+    @classmethod
+    def instance(cls) -> "ResearchTools":
+        """Process-wide shared instance (tools are stateless for callers)"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+    
     def __init__(self):
         # Initialize tools with API keys from environment
         self.serper_api_key = os.environ.get("SERPER_API_KEY")
+        self.search_tool = _get_search_tool()
+        self.scrape_tool = _get_scrape_tool()
         
-        # Web Search Tool (Google Search via Serper)
-        self.search_tool = None
-        if self.serper_api_key:
-            try:
-                self.search_tool = SerperDevTool()
-                print(f"✅ SerperDevTool initialized with API key")
-            except Exception as e:
-                print(f"⚠️  SerperDevTool initialization failed: {e}")
-        else:
-            print("⚠️  SERPER_API_KEY not found - web search disabled")
-        
-        # Website scraping tool
-        try:
-            self.scrape_tool = ScrapeWebsiteTool()
-            print(f"✅ ScrapeWebsiteTool initialized")
-        except Exception as e:
-            print(f"⚠️  ScrapeWebsiteTool initialization failed: {e}")
-            self.scrape_tool = None
+        # Tools never change after init, so the collection is built once
+        self._tools_tuple = tuple(t for t in (self.search_tool, self.scrape_tool) if t is not None)
     
     def get_research_tools(self):
-        """Get all available research tools"""
-        tools = []
-        
-        if self.search_tool:
-            tools.append(self.search_tool)
-        
-        if self.scrape_tool:
-            tools.append(self.scrape_tool)
-        
-        return tools
+        """Get all available research tools (shared tuple; do not mutate)"""
+        return self._tools_tuple
     
     def get_search_tool(self):
         """Get just the search tool"""
-        return self.search_tool if self.search_tool else None
+        return self.search_tool
     
     def is_search_available(self):
         """Check if web search is available"""
@@ -5,33 +5,84 @@ Multi-Agent Policy Deliberation System Backend
 
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
 from typing import List, Dict, Any
 from datetime import datetime
+import asyncio
 import logging
-import json
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+import orjson
 import socketio
 from dotenv import load_dotenv
 import os
 
+try:
+    import uvloop  # ships with uvicorn[standard]; not available on Windows
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import httptools  # C HTTP parser, also part of uvicorn[standard]
+    HTTPTOOLS_AVAILABLE = True
+except ImportError:
+    HTTPTOOLS_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging: records are written directly until lifespan puts the
+# handler behind a queue, so importing the app without running it (tests,
+# scripts) never leaves records stuck in a queue nobody drains
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_log_queue = SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
+log_listener = QueueListener(_log_queue, _log_handler, respect_handler_level=True)
+logging.getLogger().addHandler(_log_handler)
+logging.getLogger().setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Import policy service and routes
 from app.services.policy_service import PolicyService
 from app.api.v1.policy import router as policy_router
+from app.services.agent_system import get_all_agent_definitions_bytes, warmup
 
-# Socket.IO server
-sio = socketio.AsyncServer(async_mode='asgi', cors_allowed_origins=[
+# Origins allowed by both the HTTP API and Socket.IO. A frozenset, so the
+# per-request / per-handshake `origin in ...` checks are hash lookups
+ALLOWED_ORIGINS = frozenset({
     "http://localhost:3000",
     "http://localhost:3001",
     "http://127.0.0.1:3000",
-])
+})
+
+class OrjsonCodec:
+    """json-module stand-in for Socket.IO so every emitted packet is encoded
+    by orjson; accepts and ignores stdlib kwargs such as separators"""
+    
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    
+    @staticmethod
+    def dumps(obj, *args, **kwargs) -> str:
+        return orjson.dumps(obj, option=OrjsonCodec._OPTIONS).decode()
+    
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
+# Wire format for Socket.IO packets: "json" (orjson-encoded, the default) or
+# "msgpack" for smaller frames; msgpack clients must use socket.io-msgpack-parser
+SOCKETIO_SERIALIZER = os.getenv("KAZIWIZ_SOCKETIO_SERIALIZER", "json")
+
+# Socket.IO server
+if SOCKETIO_SERIALIZER == "msgpack":
+    sio = socketio.AsyncServer(async_mode='asgi', serializer='msgpack',
+                               cors_allowed_origins=ALLOWED_ORIGINS)
+else:
+    sio = socketio.AsyncServer(async_mode='asgi', json=OrjsonCodec,
+                               cors_allowed_origins=ALLOWED_ORIGINS)
 
 # Socket.IO event handlers
 @sio.event
@@ -79,13 +130,27 @@ ps_module.policy_service = policy_service_instance
 # Lifespan context manager
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup
+    # Startup: handlers only enqueue from here on, and the listener thread
+    # formats and writes records off the event loop
+    root_logger = logging.getLogger()
+    log_listener.start()
+    root_logger.addHandler(_queue_handler)
+    root_logger.removeHandler(_log_handler)
     logger.info("🚀 Starting Multi-Agent Policy Deliberation API")
     logger.info("📊 Initializing SHAP/LIME explainability engine")
     logger.info("🔧 Policy Service initialized with WebSocket events")
+    logger.info(f"🔁 Event loop: {type(asyncio.get_running_loop()).__module__}")
+    try:
+        await asyncio.to_thread(warmup)
+        logger.info("🔥 LLM client, tools and embedding model warmed up")
+    except Exception as e:
+        logger.warning(f"⚠️  Warmup failed, continuing with lazy initialization: {e}")
     yield
     # Shutdown
     logger.info("👋 Shutting down API")
+    root_logger.addHandler(_log_handler)
+    root_logger.removeHandler(_queue_handler)
+    log_listener.stop()
 
 # Create FastAPI app
 app = FastAPI(
@@ -98,11 +163,7 @@ app = FastAPI(
 # CORS configuration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://localhost:3001",
-        "http://127.0.0.1:3000",
-    ],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -136,16 +197,12 @@ async def health_check():
 @app.get("/api/v1/agents")
 async def list_agents():
     """List all available agent types"""
-    agents = [
-        {"id": "problem_statement", "name": "Problem Statement Expert", "category": "orchestration"},
-        {"id": "economic", "name": "Economic Analyst", "category": "core"},
-        {"id": "social", "name": "Social Dynamics Expert", "category": "core"},
-        {"id": "geospatial", "name": "Geospatial Analyst", "category": "core"},
-        {"id": "income", "name": "Income Distribution Analyst", "category": "core"},
-        {"id": "resource", "name": "Resource Management Expert", "category": "core"},
-        {"id": "legal", "name": "Legal Adviser", "category": "core"},
-    ]
-    return {"agents": agents, "total": len(agents)}
+    # Static per deployment, so serve the bytes serialized at import
+    return Response(
+        content=get_all_agent_definitions_bytes(),
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
 
 @app.get("/api/v1/tools")
 async def list_tools():
@@ -175,5 +232,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
+        loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+        http="httptools" if HTTPTOOLS_AVAILABLE else "h11",
+        ws="websockets",
         log_level="info"
     )
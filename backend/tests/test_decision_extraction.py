@@ -0,0 +1,42 @@
+"""Tests for reading the final verdict out of a voting announcement"""
+
+import pytest
+
+from app.services.output_validator import OutputValidator
+
+
+@pytest.mark.parametrize("announcement, expected", [
+    ("The council APPROVED the congestion charge.", "APPROVED"),
+    ("The panel approves the measure 14-9.", "APPROVED"),
+    ("Final verdict: REJECTED.", "REJECTED"),
+    ("The majority rejects the proposal.", "REJECTED"),
+    ("We reject this policy as drafted.", "REJECTED"),
+    ("Committee approves amendments but rejects the final bill.", "REJECTED"),
+    ("Votes: 10 approve, 13 reject. The proposal is therefore REJECTED.", "REJECTED"),
+    ("Vote is split; further review is required.", "CONDITIONAL"),
+])
+def test_last_verdict_wins_without_a_decision_line(announcement, expected):
+    assert OutputValidator.extract_decision(announcement) == expected
+
+
+@pytest.mark.parametrize("announcement, expected", [
+    ("Decision: Approve, subject to a phased rollout.", "APPROVED"),
+    ("- **DECISION:** REJECTED\n"
+     "- VOTE TALLY: 9 in favor, 14 opposed\n"
+     "- KEY ARGUMENTS FOR: several experts approve of the revenue use", "REJECTED"),
+    ("After weighing every vote, those who approve are outnumbered.\n"
+     "FINAL DECISION: APPROVED with amendments\n"
+     "Dissenters reject the timeline.", "APPROVED"),
+    ("DECISION: CONDITIONALLY APPROVED\nVOTE TALLY: 8 in favor, 5 opposed", "CONDITIONAL"),
+])
+def test_decision_line_wins(announcement, expected):
+    assert OutputValidator.extract_decision(announcement) == expected
+
+
+@pytest.mark.parametrize("announcement", [
+    "Approval is pending more data.",
+    "Stakeholders raised rejection concerns.",
+    "Disapproves",
+])
+def test_related_words_are_not_verdicts(announcement):
+    assert OutputValidator.extract_decision(announcement) == "CONDITIONAL"
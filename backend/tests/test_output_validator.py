@@ -0,0 +1,36 @@
+"""Tests for cleaning LLM output before it is stored"""
+
+import re
+
+import pytest
+
+from app.services.output_validator import OutputValidator
+
+
+def _reference_extract(output: str) -> str:
+    """The original sequential re.sub passes"""
+    output = re.sub(r'```[\w]*\n.*?```', '', output, flags=re.DOTALL)
+    output = re.sub(r'<[^>]+>', '', output)
+    output = re.sub(r'\$\$.*?\$\$', '', output, flags=re.DOTALL)
+    output = re.sub(r'^---.*?---', '', output, flags=re.DOTALL | re.MULTILINE)
+    output = re.sub(r'\n{3,}', '\n\n', output)
+    return output.strip()
+
+
+SAMPLES = [
+    "**Position:** SUPPORT\n\nThe policy raises revenue for transit.",
+    "Analysis:\n```python\ndef f():\n    return 1\n```\nThe tax is progressive.",
+    "<p>Housing costs</p> rose 12% while <b>wages</b> stalled.",
+    "Impact: $$\\frac{a}{b}$$ grows with density.\n\n\n\nConclusion follows.",
+    "---\nlayout: post\n---\nThe subsidy targets low-income renters.",
+    # Frontmatter only starts a line once the tag in front of it is removed
+    "<div>---\ntitle: draft\n---</div>\nEvidence from pilot cities.",
+    # A '<' in prose must not swallow the fenced block that follows
+    "Costs rise when x < y.\n```\nif a > b: pass\n```\nBenefits stay.",
+    "Plain text with no markup at all.",
+]
+
+
+@pytest.mark.parametrize("output", SAMPLES)
+def test_extract_policy_content_matches_sequential_passes(output):
+    assert OutputValidator.extract_policy_content(output) == _reference_extract(output)
@@ -0,0 +1,114 @@
+"""
+Policy API route tests
+
+Routes resolve the service through app.services.policy_service at call
+time, so a light in-memory stand-in is swapped in rather than the real
+service with its agent system.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app.services
+from app.api.v1.policy import router
+
+
+def _session(session_id: str, topic: str = "Carbon tax") -> SimpleNamespace:
+    return SimpleNamespace(
+        session_id=session_id,
+        policy_topic=topic,
+        background_context="",
+        status="initializing",
+        current_phase=0,
+        phase_name="Initialization",
+        created_at="2024-01-01T00:00:00",
+        updated_at="2024-01-01T00:00:00",
+    )
+
+
+class FakePolicyService:
+    def __init__(self):
+        self.sessions = {}
+
+    async def create_session(self, policy_data: dict):
+        session = _session(f"s{len(self.sessions)}", policy_data["policy_topic"])
+        self.sessions[session.session_id] = session
+        return session
+
+    def get_session(self, session_id: str):
+        return self.sessions.get(session_id)
+
+    def list_sessions(self, limit=None, offset=0):
+        sessions = list(self.sessions.values())
+        return sessions[offset:offset + limit if limit is not None else None]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    service = FakePolicyService()
+    monkeypatch.setattr(app.services, "policy_service", SimpleNamespace(policy_service=service))
+    api = FastAPI()
+    api.include_router(router)
+    return TestClient(api)
+
+
+def test_create_get_and_list_sessions(client):
+    created = client.post("/api/v1/policy/create", json={
+        "policy_topic": "Carbon tax",
+        "background_context": "Urban emissions",
+    })
+    assert created.status_code == 200
+    body = created.json()
+    assert body["session_id"] == "s0"
+    assert body["policy_topic"] == "Carbon tax"
+
+    fetched = client.get("/api/v1/policy/session/s0")
+    assert fetched.status_code == 200
+    assert fetched.json() == body
+
+    listed = client.get("/api/v1/policy/sessions")
+    assert listed.status_code == 200
+    assert [s["session_id"] for s in listed.json()] == ["s0"]
+
+
+def test_get_session_revalidates_with_etag(client):
+    client.post("/api/v1/policy/create", json={"policy_topic": "t", "background_context": ""})
+    first = client.get("/api/v1/policy/session/s0")
+    etag = first.headers["etag"]
+
+    again = client.get("/api/v1/policy/session/s0", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "W/{etag}",
+    '"stale", {etag}',
+    '"stale",W/{etag}',
+    "*",
+])
+def test_get_session_etag_forms(client, if_none_match):
+    client.post("/api/v1/policy/create", json={"policy_topic": "t", "background_context": ""})
+    etag = client.get("/api/v1/policy/session/s0").headers["etag"]
+
+    again = client.get("/api/v1/policy/session/s0",
+                       headers={"If-None-Match": if_none_match.format(etag=etag)})
+    assert again.status_code == 304
+
+
+def test_get_session_stale_etag_gets_body(client):
+    client.post("/api/v1/policy/create", json={"policy_topic": "t", "background_context": ""})
+
+    again = client.get("/api/v1/policy/session/s0", headers={"If-None-Match": '"stale", W/"older"'})
+    assert again.status_code == 200
+    assert again.json()["session_id"] == "s0"
+
+
+def test_unknown_session_is_404(client):
+    assert client.get("/api/v1/policy/session/missing").status_code == 404
@@ -0,0 +1,117 @@
+"""
+Semantic cache tests
+
+A stand-in embedder maps every prompt to the same vector, the worst case
+of a truncating sentence embedder on long shared templates, so any hit
+across scopes would show up as a wrong answer.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.services.semantic_cache import (
+    SemanticCache, cached_execute_task, make_scope, scoped
+)
+
+TEMPLATE = "Research and analyze: {topic}\n\nYOUR FOCUS AREA: Economic Impact\n" + "boilerplate " * 400
+
+
+class CollapsingEmbedder:
+    def encode(self, texts, convert_to_numpy=True, normalize_embeddings=True):
+        return np.ones((len(texts), 8), dtype=np.float32) / np.sqrt(8)
+
+
+def _cache(capacity: int = 8) -> SemanticCache:
+    cache = SemanticCache(capacity=capacity)
+    cache.enabled = True
+    cache._model = CollapsingEmbedder()
+    return cache
+
+
+def _agent(cache: SemanticCache):
+    calls = []
+
+    def execute_task(task, context=None, tools=None):
+        calls.append(task.description)
+        return f"answer for {task.description[:40]}"
+
+    agent = SimpleNamespace(role="Economic Analyst", execute_task=execute_task)
+    return cached_execute_task(agent, cache), calls
+
+
+def test_different_topics_do_not_share_entries():
+    agent, calls = _agent(_cache())
+    carbon = SimpleNamespace(description=TEMPLATE.format(topic="Carbon tax"))
+    housing = SimpleNamespace(description=TEMPLATE.format(topic="Housing subsidy"))
+
+    with scoped(make_scope("Carbon tax", "research")):
+        first = agent.execute_task(carbon)
+    with scoped(make_scope("Housing subsidy", "research")):
+        second = agent.execute_task(housing)
+
+    assert len(calls) == 2
+    assert "Carbon tax" in first and "Housing subsidy" in second
+
+
+def test_same_topic_and_task_kind_is_served_from_cache():
+    agent, calls = _agent(_cache())
+    task = SimpleNamespace(description=TEMPLATE.format(topic="Carbon tax"))
+
+    with scoped(make_scope("Carbon  TAX", "research")):
+        first = agent.execute_task(task)
+    with scoped(make_scope("carbon tax", "research")):
+        second = agent.execute_task(task)
+
+    assert len(calls) == 1
+    assert first == second
+
+
+def test_debate_rounds_are_separate_scopes():
+    agent, calls = _agent(_cache())
+    task = SimpleNamespace(description=TEMPLATE.format(topic="Carbon tax"))
+
+    for round_num in (1, 2):
+        with scoped(make_scope("Carbon tax", f"debate:{round_num}")):
+            agent.execute_task(task)
+
+    assert len(calls) == 2
+
+
+def test_unscoped_calls_bypass_the_cache():
+    agent, calls = _agent(_cache())
+    task = SimpleNamespace(description=TEMPLATE.format(topic="Carbon tax"))
+
+    agent.execute_task(task)
+    agent.execute_task(task)
+
+    assert len(calls) == 2
+
+
+def test_evicting_a_bucket_forgets_its_label():
+    cache = _cache(capacity=1)
+    cache.put("q", "a", "1")
+    cache.put("q", "b", "2")
+
+    assert cache.get("q", "a") is None
+    assert cache.get("q", "b") == "2"
+    assert set(cache._roles) == {"b"}
+
+
+
+def test_votes_after_different_debates_are_not_shared():
+    # Votes run unscoped: their prompt names only the topic, so two
+    # deliberations on one topic must each get a vote from their own debate
+    def execute_task(task, context=None, tools=None):
+        return "APPROVE" if "in favour" in context else "REJECT"
+
+    voter = SimpleNamespace(role="Economic Analyst", execute_task=execute_task)
+    agent = cached_execute_task(voter, _cache())
+    vote = SimpleNamespace(description=TEMPLATE.format(topic="Carbon tax"))
+
+    first = agent.execute_task(vote, context="Debate: experts argued in favour.")
+    second = agent.execute_task(vote, context="Debate: experts argued against.")
+
+    assert (first, second) == ("APPROVE", "REJECT")
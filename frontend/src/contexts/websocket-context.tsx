@@ -43,6 +43,14 @@ export function WebSocketProvider({ children }: { children: ReactNode }) {
       console.log(`🔔 Socket event received: ${eventName}`, args);
     });
 
+    // The backend coalesces bursts of events into one frame; replay each
+    // to the listeners registered for its own event name
+    socketInstance.on("events_batch", (batch: { events: { event: string; data: any }[] }) => {
+      for (const { event, data } of batch.events) {
+        socketInstance.listeners(event).forEach((listener) => listener(data));
+      }
+    });
+
     socketInstance.on("connect_error", (error) => {
       console.error("WebSocket connection error:", error);
       setConnectionStatus("Connection Error");